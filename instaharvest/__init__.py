@@ -104,6 +104,7 @@ from .base import BaseScraper
 from .profile import ProfileScraper, ProfileData
 from .post_links import InstagramPostLinksScraper, PostLinksScraper
 from .post_data import PostDataScraper, PostData
+from .fast_post import FastPostScraper
 from .reel_links import ReelLinksScraper
 from .reel_data import ReelDataScraper, ReelData
 from .parallel_scraper import ParallelPostDataScraper
@@ -141,6 +142,7 @@ __all__ = [
     'PostLinksScraper',
     'InstagramPostLinksScraper',
     'PostDataScraper',
+    'FastPostScraper',
     'ReelLinksScraper',
     'ReelDataScraper',
     'ParallelPostDataScraper',
@@ -6,7 +6,7 @@ Professional base class with error handling, logging, and retry logic
 import json
 import time
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from abc import ABC, abstractmethod
 
 from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page, Playwright
@@ -19,6 +19,25 @@ from .exceptions import (
     LoginRequiredError
 )
 from .logger import setup_logger
+from .session_utils import read_json_file
+
+
+def _block_page_media(context: BrowserContext, page: Page, blocked_url_patterns: List[str]) -> Any:
+    """
+    Let Chromium drop requests matching blocked_url_patterns (images/video/fonts) for a page
+
+    For scrapers that only read the DOM, media is wasted bandwidth. Blocking
+    goes through CDP rather than page.route(), which would send every request
+    through Python and turn the HTTP cache off; the cache is kept on explicitly.
+
+    Returns:
+        The CDP session (raises if CDP is unavailable)
+    """
+    cdp = context.new_cdp_session(page)
+    cdp.send('Network.enable')
+    cdp.send('Network.setCacheDisabled', {'cacheDisabled': False})
+    cdp.send('Network.setBlockedURLs', {'urls': blocked_url_patterns})
+    return cdp
 
 
 class BaseScraper(ABC):
@@ -78,8 +97,7 @@ class BaseScraper(ABC):
         self.check_session_exists()
 
         try:
-            with open(self.config.session_file, 'r', encoding='utf-8') as f:
-                session_data = json.load(f)
+            session_data = read_json_file(self.config.session_file)
             self.logger.info(f"Session loaded: {len(session_data.get('cookies', []))} cookies")
             return session_data
         except (json.JSONDecodeError, IOError, OSError, PermissionError) as e:
@@ -128,7 +146,8 @@ class BaseScraper(ABC):
             # Launch browser with real Chrome
             self.browser = self.playwright.chromium.launch(
                 channel=self.config.browser_channel,  # Use real Chrome instead of Chromium
-                headless=self.config.headless
+                headless=self.config.headless,
+                args=self.config.browser_args
             )
             self.logger.debug(f"Browser launched (Chrome, headless={self.config.headless})")
 
@@ -351,6 +370,50 @@ class BaseScraper(ABC):
             # Conservative approach: if we can't tell, assume login required
             return True
 
+    def _block_media(self, page: Page) -> Optional[Any]:
+        """
+        Let Chromium drop images/video/fonts for a page (config.blocked_url_patterns, see _block_page_media)
+
+        Returns:
+            The CDP session for _unblock_media() (None if blocking is off or unavailable)
+        """
+        if not self.config.blocked_url_patterns:
+            return None
+        try:
+            return _block_page_media(self.context, page, self.config.blocked_url_patterns)
+        except Exception as e:
+            self.logger.debug(f"Media blocking unavailable: {e}")
+            return None
+
+    def _unblock_media(self, cdp: Optional[Any]) -> None:
+        """Load media again on a page blocked by _block_media() (e.g. a page that outlives the scrape)"""
+        if cdp is None:
+            return
+        try:
+            cdp.send('Network.setBlockedURLs', {'urls': []})
+            cdp.detach()
+        except Exception:
+            pass
+
+    def _page_contains_any(self, texts) -> bool:
+        """
+        Check whether the current page's text contains any of the given strings
+
+        Searched in the browser (title and body text, scripts included), so only
+        a boolean crosses over instead of the serialized page HTML.
+
+        Args:
+            texts: Strings to look for
+
+        Returns:
+            True if at least one string is found
+        """
+        return self.page.evaluate(
+            "(texts) => { const text = document.documentElement.textContent; "
+            "return texts.some(t => text.includes(t)); }",
+            list(texts)
+        )
+
     def safe_extract(
         self,
         extractor_func,
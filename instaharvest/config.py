@@ -42,12 +42,46 @@ class ScraperConfig:
     viewport_height: int = 720   # Browser window height (smaller for better fit)
     user_agent: str = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
     browser_channel: str = 'chrome'  # Browser channel to use
-    browser_args: List[str] = field(default_factory=lambda: ['--start-maximized'])  # Browser launch arguments
+    browser_args: List[str] = field(default_factory=lambda: [
+        '--start-maximized',
+        # Lean flags: skip Chrome services that scraping never uses
+        '--disable-background-networking',
+        '--disable-background-timer-throttling',
+        '--disable-breakpad',
+        '--disable-client-side-phishing-detection',
+        '--disable-default-apps',
+        '--disable-extensions',
+        '--disable-hang-monitor',
+        '--disable-ipc-flooding-protection',
+        '--disable-prompt-on-repost',
+        '--disable-renderer-backgrounding',
+        '--disable-sync',
+        '--disable-translate',
+        '--metrics-recording-only',
+        '--no-first-run',
+        '--no-default-browser-check',
+        '--disable-dev-shm-usage',  # Use /tmp instead of the small /dev/shm in Docker
+        '--disable-gpu',  # Nothing is rendered on screen; skips GPU process start-up
+        '--disable-blink-features=AutomationControlled',  # No navigator.webdriver flag
+    ])  # Browser launch arguments
+    parallel_shared_browser: bool = True  # Parallel workers share one browser over CDP instead of one each
+    cdp_port: int = 0  # Remote debugging port of the shared parallel browser (0 = any free port)
+    cdp_startup_timeout: float = 10.0  # Max seconds to wait for the shared browser to accept connections
+    pin_worker_cpus: bool = False  # Linux: pin each parallel worker (and the browser it launches) to one core
+    blocked_url_patterns: List[str] = field(default_factory=lambda: [
+        '*.jpg*', '*.jpeg*', '*.png*', '*.webp*', '*.gif*', '*.heic*',  # Images
+        '*.mp4*', '*.m4a*', '*.m4v*',  # Video / audio
+        '*.woff*', '*.ttf*', '*.otf*',  # Fonts
+    ])  # Post data / post links scraping: URLs Chromium never downloads (empty list = load everything)
 
     # ==================== INSTAGRAM URLS ====================
     instagram_base_url: str = 'https://www.instagram.com/'
     profile_url_pattern: str = 'https://www.instagram.com/{username}/'  # {username} will be replaced
     reels_url_pattern: str = 'https://www.instagram.com/{username}/reels/'  # {username} will be replaced
+    media_info_url_pattern: str = 'https://www.instagram.com/api/v1/media/{media_id}/info/'  # {media_id} will be replaced
+    user_feed_url_pattern: str = 'https://www.instagram.com/api/v1/feed/user/{username}/username/?count={count}&max_id={max_id}'  # Profile's posts, paginated by max_id
+    post_url_pattern: str = 'https://www.instagram.com/{kind}/{shortcode}/'  # {kind} is 'p' or 'reel'
+    instagram_app_id: str = '936619743392459'  # X-IG-App-ID sent by instagram.com web requests
 
     # ==================== TIMEOUTS (milliseconds) ====================
     default_timeout: int = 60000
@@ -71,8 +105,12 @@ class ScraperConfig:
     tag_button_click_timeout: int = 3000  # Tag button click timeout
     popup_close_timeout: int = 2000  # Popup close timeout
     post_tag_wait_timeout: int = 5000  # Post tag wait timeout
+    post_tag_settle_timeout: int = 1000  # Tag wait once the post has rendered (timestamp / likes found)
+    post_tag_stable_delay: int = 150  # In-page tag snapshot: ms the tag container count must hold before it is used
     reel_likes_timeout: int = 3000  # Reel likes timeout
     reel_element_timeout: int = 3000  # Reel element timeout
+    post_ready_timeout: int = 8000  # Max wait for the post landmark (timestamp / like button) after navigation
+    post_content_timeout: int = 5000  # Max wait for the post content container when reading its HTML
 
     # ==================== PAGE NAVIGATION DELAYS ====================
     page_load_delay: float = 2.0  # Wait after page loads
@@ -100,7 +138,7 @@ class ScraperConfig:
     scroll_content_load_delay: float = 0.8  # Wait for content after scroll
     scroll_lazy_load_delay: float = 1.5  # Wait for lazy-loaded content
     scroll_viewport_percentage: float = 0.8  # Scroll percentage for viewport
-    scroll_wait_range: tuple = (1.5, 2.5)  # Random wait range for scrolling
+    scroll_wait_range: tuple = (1.5, 2.5)  # Random max wait for new links after each scroll
 
     # ==================== SCROLL BEHAVIOR SETTINGS ====================
     # Container-based scrolling (for post/reel link collection)
@@ -142,6 +180,20 @@ class ScraperConfig:
     message_delay_max: float = 5.0  # Max delay after sending message
     batch_operation_delay_min: float = 2.0  # Min delay between batch operations
     batch_operation_delay_max: float = 4.0  # Max delay between batch operations
+    post_burst_size: int = 10  # scrape_multiple: posts per burst of short delays before a long pause (0 = post_scrape_delay every time)
+    post_burst_delay_min: float = 0.5  # Min delay between posts inside a burst
+    post_burst_delay_max: float = 1.5  # Max delay between posts inside a burst
+    post_burst_pause_min: float = 15.0  # Min pause after a burst
+    post_burst_pause_max: float = 30.0  # Max pause after a burst
+    post_failure_backoff_base: float = 2.0  # Extra delay = base ** consecutive failed posts
+    post_failure_backoff_max: float = 60.0  # Cap for the failure backoff
+    throttle_base_delay_min: float = 1.0  # Min per-URL delay in parallel workers, even while Instagram is happy
+    throttle_base_delay_max: float = 2.0  # Max per-URL delay in parallel workers, even while Instagram is happy
+    throttle_min_delay: float = 0.5  # First extra per-URL delay after a 429/timeout/login redirect (doubles on repeats)
+    throttle_max_delay: float = 30.0  # Upper bound for the adaptive per-URL delay
+    throttle_cooldown: float = 30.0  # Hold the penalty this long after the last 429/timeout/login redirect
+    throttle_target_rtt: float = 3.0  # Median navigation time above which pacing slows down
+    throttle_rtt_window: int = 10  # Number of recent navigations used for the median
 
     # ==================== RETRY DELAYS ====================
     retry_delay: float = 2.0  # Delay before retry on failure
@@ -174,6 +226,17 @@ class ScraperConfig:
     diagnostics_reel_success_threshold_ok: int = 70  # Reel diagnostics success rate (OK)
     diagnostics_reel_success_threshold_partial: int = 40  # Reel diagnostics success rate (PARTIAL)
     reel_max_span_check: int = 20  # Max span elements to check for reels
+    pages_per_context_recycle: int = 25  # Recycle a parallel worker's browser context after N URLs
+    contexts_per_worker: int = 1  # Concurrent contexts per parallel worker (pages in flight = parallel x this; opt-in above 1)
+    post_scrape_concurrency: int = 3  # PostDataScraper.scrape_multiple: posts loading at once in one context (1 = one by one)
+    post_api_fast_path: bool = True  # scrape_multiple: try the JSON media API first, browser only for the rest
+    post_api_concurrency: int = 4  # Concurrent media API requests (only when delay_between_posts is off; paced one by one otherwise)
+    post_api_timeout: float = 10.0  # Seconds per media API request
+    post_links_api_fast_path: bool = True  # PostLinksScraper: list links from the JSON feed, scroll the grid only if it fails
+    post_links_api_page_size: int = 33  # Posts per feed API request
+    post_links_api_delay: float = 1.0  # Seconds between feed API requests
+    browser_pool_size: int = 0  # scrape_multiple: logged-in browsers kept open between calls, one per session file (0 = close each time)
+    task_queue_timeout: float = 1.0  # Seconds a parallel worker waits on an empty task queue before finishing
 
     # ==================== LOGGING ====================
     log_file: Optional[str] = 'instagram_scraper.log'
@@ -181,6 +244,7 @@ class ScraperConfig:
     log_to_console: bool = True
     log_format: str = '%(asctime)s [%(levelname)s] %(name)s: %(message)s'
     log_date_format: str = '%Y-%m-%d %H:%M:%S'
+    worker_log_buffer: int = 64  # Parallel workers: log records written per batch (1 = write every line)
 
     # ==================== OUTPUT FILES ====================
     links_file: str = 'post_links.txt'
@@ -190,6 +254,8 @@ class ScraperConfig:
 
     # ==================== EXCEL SETTINGS ====================
     excel_max_column_width: int = 50  # Max column width in Excel
+    excel_flush_rows: int = 32  # Parallel scraping: buffer up to N results before one Excel write
+    excel_flush_interval: float = 2.0  # Parallel scraping: max seconds a buffered result waits for Excel
     excel_columns: List[str] = field(default_factory=lambda: [
         'Post URL', 'Type', 'Tagged Accounts', 'Likes', 'Timestamp'
     ])
@@ -209,6 +275,7 @@ class ScraperConfig:
     # ==================== PAGE LOAD STRATEGIES ====================
     page_load_wait_until: str = 'domcontentloaded'  # Default page load strategy
     session_save_wait_until: str = 'networkidle'  # Wait strategy for session save
+    post_navigation_wait_until: str = 'commit'  # Parallel workers wait for the post landmark instead
 
     # ==================== DETECTION STRINGS ====================
     login_detection_strings: List[str] = field(default_factory=lambda: ['loginForm', 'login'])
@@ -245,12 +312,20 @@ class ScraperConfig:
     selector_post_tag_container: str = 'div._aa1y'
     selector_post_tag: str = 'div._aa1y'
 
+    # Post readiness selector (rendered once the post content is usable): timestamp, caption
+    # or like button - any one is enough, posts with hidden like counts have no like button
+    selector_post_ready: str = 'time, article h1, section span[role="button"]'
+    selector_post_like_button: str = 'section span[role="button"]'  # Like/comment count buttons (the first two are likes candidates)
+    selector_post_content: str = 'main, article'  # Container whose HTML is parsed for tags/likes/timestamp
+    selector_og_description: str = 'meta[property="og:description"]'  # "1,234 likes, 56 comments - ..." (likes fallback)
+
     # Follower selectors
     selector_follower_container: str = 'div.x1dm5mii.x16mil14.xieb3on.x1e56ztr.x1lliihq.x193iq5w.xh8yej3'
     selector_follower_username_span: str = 'span.xjp7ctv'
 
     # Reel selectors
     selector_reel_container: str = 'div._ac7v.x1ty9z65.xzboxd6'
+    selector_reel_links: str = 'a[href*="/reel/"]'  # Reel links inside a reel grid container
     selector_reel_likes: str = 'span.x1ypdohk.xt0psk2.x1xlr1w8.xzsf02u'
     selector_reel_timestamp: str = 'time.x1p4m5qa'
 
@@ -238,6 +238,46 @@ class ExcelExporter:
         except Exception as e:
             self.logger.error(f"Failed to write to Excel: {e}")
 
+    def _build_rows(
+        self,
+        post_url: str,
+        tagged_accounts: List[str],
+        likes: str,
+        post_date: str,
+        content_type: str,
+        scraping_time: str
+    ) -> List[Dict[str, Any]]:
+        """Build the Excel row(s) for one post"""
+        if self.separate_tags:
+            # HAR BIR TAG ALOHIDA QATORDA
+            return [
+                {
+                    'Post URL': post_url,
+                    'Type': content_type,
+                    'Tagged Account': tag,
+                    'Likes Count': likes,
+                    'Post Date': post_date,
+                    'Scraping Date/Time': scraping_time
+                }
+                for tag in (tagged_accounts or ['No tags'])
+            ]
+
+        # ESKI LOGIKA: Barcha taglar bitta qatorda
+        tags_str = ', '.join(tagged_accounts) if tagged_accounts else 'No tags'
+        return [{
+            'Post URL': post_url,
+            'Type': content_type,
+            'Tagged Accounts': tags_str,
+            'Likes Count': likes,
+            'Post Date': post_date,
+            'Scraping Date/Time': scraping_time
+        }]
+
+    def _save_if_batch_full(self, previous_count: int) -> None:
+        """Write to Excel when new rows crossed a batch_size boundary"""
+        if len(self.rows) // self.batch_size > previous_count // self.batch_size:
+            self._write_to_excel()
+
     def add_row(
         self,
         post_url: str,
@@ -258,71 +298,44 @@ class ExcelExporter:
         """
         try:
             scraping_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            previous_count = len(self.rows)
 
-            if self.separate_tags:
-                # HAR BIR TAG ALOHIDA QATORDA
-                if not tagged_accounts:
-                    row_dict = {
-                        'Post URL': post_url,
-                        'Type': content_type,
-                        'Tagged Account': 'No tags',
-                        'Likes Count': likes,
-                        'Post Date': post_date,
-                        'Scraping Date/Time': scraping_time
-                    }
-                    self.rows.append(row_dict)
-                else:
-                    for tag in tagged_accounts:
-                        row_dict = {
-                            'Post URL': post_url,
-                            'Type': content_type,
-                            'Tagged Account': tag,
-                            'Likes Count': likes,
-                            'Post Date': post_date,
-                            'Scraping Date/Time': scraping_time
-                        }
-                        self.rows.append(row_dict)
-                
-                self.logger.debug(f"Added {len(tagged_accounts) if tagged_accounts else 1} rows [{content_type}]: {post_url}")
-            
-            else:
-                # ESKI LOGIKA: Barcha taglar bitta qatorda
-                tags_str = ', '.join(tagged_accounts) if tagged_accounts else 'No tags'
-                
-                row_dict = {
-                    'Post URL': post_url,
-                    'Type': content_type,
-                    'Tagged Accounts': tags_str,
-                    'Likes Count': likes,
-                    'Post Date': post_date,
-                    'Scraping Date/Time': scraping_time
-                }
-                self.rows.append(row_dict)
-                
-                self.logger.debug(f"Added row to Excel [{content_type}]: {post_url}")
+            rows = self._build_rows(post_url, tagged_accounts, likes, post_date, content_type, scraping_time)
+            self.rows.extend(rows)
+            self.logger.debug(f"Added {len(rows)} rows [{content_type}]: {post_url}")
 
             # Har batch_size ta rowda saqlash
-            if len(self.rows) % self.batch_size == 0:
-                self._write_to_excel()
+            self._save_if_batch_full(previous_count)
 
         except Exception as e:
             self.logger.error(f"Failed to add row to Excel: {e}")
 
     def add_multiple_rows(self, data: List[Dict[str, Any]]) -> None:
         """
-        Add multiple rows at once
+        Add multiple rows at once (at most one Excel write)
 
         Args:
             data: List of dictionaries with post data
         """
-        for item in data:
-            self.add_row(
-                post_url=item.get('url', 'N/A'),
-                tagged_accounts=item.get('tagged_accounts', []),
-                likes=item.get('likes', 'N/A'),
-                post_date=item.get('timestamp', 'N/A'),
-                content_type=item.get('content_type', 'Post')
-            )
+        try:
+            scraping_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            previous_count = len(self.rows)
+
+            for item in data:
+                self.rows.extend(self._build_rows(
+                    post_url=item.get('url', 'N/A'),
+                    tagged_accounts=item.get('tagged_accounts', []),
+                    likes=item.get('likes', 'N/A'),
+                    post_date=item.get('timestamp', 'N/A'),
+                    content_type=item.get('content_type', 'Post'),
+                    scraping_time=scraping_time
+                ))
+            self.logger.debug(f"Added {len(self.rows) - previous_count} rows for {len(data)} posts")
+
+            self._save_if_batch_full(previous_count)
+
+        except Exception as e:
+            self.logger.error(f"Failed to add rows to Excel: {e}")
 
     def get_row_count(self) -> int:
         """Get current number of rows"""
@@ -0,0 +1,238 @@
+"""
+Instagram Scraper - Browserless post data fetcher
+Reads tags, likes and timestamp from Instagram's JSON media API, and a
+profile's post/reel links from its JSON feed, with the saved session
+cookies (no page rendering)
+"""
+
+import logging
+import time
+import urllib.error
+import urllib.request
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Iterator, Callable
+
+from .config import ScraperConfig
+from .post_data import PostData, _shortcode
+from .session_utils import read_json_file, parse_json_bytes
+
+
+# Shortcodes are the media id in URL-safe base64 (private posts append extra characters)
+_SHORTCODE_ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_'
+_SHORTCODE_LENGTH = 11
+
+
+class FastPostScraper:
+    """
+    Browserless post/reel data and post link fetcher
+
+    One JSON request per post (or feed page) instead of a rendered page. Returns None for
+    anything the API does not answer cleanly (non-200, login redirect,
+    unexpected payload) so callers can fall back to the Playwright path.
+    After a 429 every further request is skipped for the rest of the run.
+    """
+
+    def __init__(
+        self,
+        config: Optional[ScraperConfig] = None,
+        session_data: Optional[Dict[str, Any]] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize fast post fetcher
+
+        Args:
+            config: Scraper configuration
+            session_data: Saved session (storage_state); read from config.session_file if None
+            logger: Logger instance
+        """
+        self.config = config or ScraperConfig()
+        self.logger = logger or logging.getLogger(__name__)
+        if session_data is None:
+            session_data = read_json_file(self.config.session_file)
+
+        cookies = {
+            cookie['name']: cookie['value']
+            for cookie in session_data.get('cookies', [])
+            if 'instagram.com' in cookie.get('domain', '')
+        }
+        self.headers = {
+            'User-Agent': self.config.user_agent,
+            'Accept': 'application/json',
+            'X-IG-App-ID': self.config.instagram_app_id,
+            'X-Requested-With': 'XMLHttpRequest',
+            'X-CSRFToken': cookies.get('csrftoken', ''),
+            'Cookie': '; '.join(f'{name}={value}' for name, value in cookies.items()),
+        }
+        self.rate_limited = False
+
+    @staticmethod
+    def media_id(post_url: str) -> Optional[str]:
+        """Media id encoded in the post/reel URL's shortcode (None if the URL has none)"""
+        shortcode = _shortcode(post_url)
+        if shortcode is None:
+            return None
+
+        media_id = 0
+        for char in shortcode[:_SHORTCODE_LENGTH]:
+            media_id = media_id * 64 + _SHORTCODE_ALPHABET.index(char)
+        return str(media_id)
+
+    def fetch(self, post_url: str) -> Optional[PostData]:
+        """
+        Fetch one post/reel
+
+        Args:
+            post_url: URL of the post/reel
+
+        Returns:
+            PostData, or None if the browser path is needed
+        """
+        media_id = self.media_id(post_url)
+        if media_id is None:
+            return None
+
+        payload = self._get_json(self.config.media_info_url_pattern.format(media_id=media_id), post_url)
+        try:
+            return self._to_post_data(post_url, payload['items'][0])
+        except (KeyError, IndexError, TypeError, AttributeError, ValueError, OverflowError, OSError) as e:
+            # No payload (see _get_json) or an unexpected one
+            self.logger.debug(f"Media API unusable for {post_url}: {e}")
+            return None
+
+    def fetch_post_links(self, username: str, limit: Optional[int] = None) -> Optional[List[str]]:
+        """
+        List a profile's post/reel URLs from its JSON feed, newest first
+
+        One request per config.post_links_api_page_size posts instead of a
+        scroll round per grid row.
+
+        Args:
+            username: Instagram username
+            limit: Stop once this many links are collected (None = all)
+
+        Returns:
+            Post/reel URLs, or None if the browser path is needed
+        """
+        profile_url = self.config.profile_url_pattern.format(username=username)
+        links: List[str] = []
+        max_id = ''
+
+        while limit is None or len(links) < limit:
+            payload = self._get_json(
+                self.config.user_feed_url_pattern.format(
+                    username=quote(username),
+                    count=self.config.post_links_api_page_size,
+                    max_id=quote(max_id)
+                ),
+                profile_url
+            )
+            try:
+                items = payload['items']
+                more_available = payload.get('more_available', False)
+                max_id = str(payload.get('next_max_id') or '')
+                for item in items:
+                    kind = 'reel' if item.get('product_type') == 'clips' else 'p'
+                    links.append(self.config.post_url_pattern.format(kind=kind, shortcode=item['code']))
+            except (KeyError, TypeError, AttributeError) as e:
+                # No payload (see _get_json) or an unexpected one: a partial list is not used
+                self.logger.debug(f"Feed API unusable for @{username}: {e}")
+                return None
+
+            if not more_available or not max_id or not items:
+                break
+            time.sleep(self.config.post_links_api_delay)
+
+        return links[:limit] if limit is not None else links
+
+    def _get_json(self, url: str, referer: str) -> Optional[Dict[str, Any]]:
+        """
+        GET one JSON API URL with the session headers
+
+        Returns:
+            The decoded payload, or None (non-200, network error, login page instead of JSON).
+            After a 429 every further request returns None for the rest of the run.
+        """
+        if self.rate_limited:
+            return None
+
+        request = urllib.request.Request(url, headers={**self.headers, 'Referer': referer})
+        try:
+            with urllib.request.urlopen(request, timeout=self.config.post_api_timeout) as response:
+                return parse_json_bytes(response.read())
+        except urllib.error.HTTPError as e:
+            if e.code == 429:
+                self.logger.warning("⚠️ Instagram API rate limited (HTTP 429), using the browser for the rest")
+                self.rate_limited = True
+            else:
+                self.logger.debug(f"Instagram API HTTP {e.code} for {referer}")
+            return None
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            self.logger.debug(f"Instagram API unusable for {referer}: {e}")
+            return None
+
+    def fetch_many(self, post_urls: List[str]) -> List[Optional[PostData]]:
+        """
+        Fetch several posts/reels concurrently (config.post_api_concurrency requests at once)
+
+        Returns:
+            One entry per URL, in order (None where the browser path is needed)
+        """
+        return list(self.iter_fetch(post_urls))
+
+    def iter_fetch(
+        self,
+        post_urls: List[str],
+        pacing: Optional[Callable[[], float]] = None
+    ) -> Iterator[Optional[PostData]]:
+        """
+        Like fetch_many(), yielding each entry (in order) as soon as it is available
+
+        Args:
+            post_urls: URLs of the posts/reels
+            pacing: Seconds to wait before each request after the first; when given,
+                requests are sent one at a time instead of concurrently
+        """
+        if not post_urls:
+            return
+        if pacing is not None:
+            for n, post_url in enumerate(post_urls):
+                # No pause once rate limited: fetch() returns None without a request
+                if n and not self.rate_limited:
+                    time.sleep(pacing())
+                yield self.fetch(post_url)
+            return
+        with ThreadPoolExecutor(max_workers=max(1, self.config.post_api_concurrency)) as executor:
+            yield from executor.map(self.fetch, post_urls)
+
+    def _to_post_data(self, post_url: str, item: Dict[str, Any]) -> PostData:
+        """Map a media info item to PostData (same value formats as the browser path)"""
+        tagged = []
+        seen = set()
+        for media in [item] + (item.get('carousel_media') or []):
+            for usertag in (media.get('usertags') or {}).get('in') or []:
+                username = (usertag.get('user') or {}).get('username')
+                # Filter out system paths
+                if username and username not in self.config.instagram_system_paths and username not in seen:
+                    seen.add(username)
+                    tagged.append(username)
+
+        like_count = item.get('like_count')
+        taken_at = item.get('taken_at')
+        if taken_at:
+            # Same form as the <time title="..."> the browser path reads, e.g. "Nov 17, 2025";
+            # the page renders that title in the local time zone, so the date is local too
+            taken = datetime.fromtimestamp(taken_at)
+            timestamp = f"{taken:%b} {taken.day}, {taken.year}"
+        else:
+            timestamp = 'N/A'
+
+        return PostData(
+            url=post_url,
+            tagged_accounts=tagged or [self.config.default_no_tags_text],
+            likes=str(like_count) if like_count is not None else 'N/A',
+            timestamp=timestamp,
+            content_type='Reel' if '/reel/' in post_url else 'Post'
+        )
@@ -4,6 +4,7 @@ Professional logging with timestamps and levels
 """
 
 import logging
+import logging.handlers
 import sys
 from pathlib import Path
 from typing import Optional
@@ -61,3 +62,48 @@ def setup_logger(
         logger.addHandler(file_handler)
 
     return logger
+
+
+def setup_buffered_logger(
+    name: str,
+    level: str = 'INFO',
+    capacity: int = 64,
+    config: Optional[ScraperConfig] = None
+) -> logging.Logger:
+    """
+    Setup console logger that writes records in batches
+
+    Records are held in memory and written to stdout every `capacity`
+    records (ERROR and above are written immediately), so chatty worker
+    processes issue one write per batch instead of one per line.
+    Call flush_logger() before the process finishes.
+
+    Args:
+        name: Logger name
+        level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        capacity: Number of records buffered before writing
+        config: ScraperConfig instance (optional)
+
+    Returns:
+        Configured logger instance
+    """
+    if config is None:
+        config = ScraperConfig()
+
+    logger = setup_logger(name, level=level, log_to_console=False, config=config)
+
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(logging.Formatter(config.log_format, datefmt=config.log_date_format))
+    logger.addHandler(logging.handlers.MemoryHandler(
+        max(1, capacity),
+        flushLevel=logging.ERROR,
+        target=console_handler
+    ))
+
+    return logger
+
+
+def flush_logger(logger: logging.Logger) -> None:
+    """Write out any records still buffered by the logger's handlers"""
+    for handler in logger.handlers:
+        handler.flush()
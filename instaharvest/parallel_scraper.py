@@ -4,33 +4,100 @@ Scrape multiple posts simultaneously with multiple browser contexts
 """
 
 import time
-import random
 import json
+import logging
+import os
+import random
+import re
 import signal
-from typing import List, Optional, Dict, Any
-from multiprocessing import Pool, cpu_count, Manager, Queue
-from bs4 import BeautifulSoup
+import socket
+import queue
+import statistics
+import threading
+import shutil
+import subprocess
+import sys
+import tempfile
+import urllib.request
+from typing import List, Optional, Dict, Any, Tuple
+from collections import deque
+from multiprocessing import cpu_count, Event, Queue, Value
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from lxml import etree, html as lxml_html
 from datetime import datetime
 
-from playwright.sync_api import sync_playwright, Page
+from playwright.sync_api import sync_playwright, Page, TimeoutError as PlaywrightTimeoutError
 
+from .base import _block_page_media
 from .config import ScraperConfig
-from .post_data import PostData
-from .logger import setup_logger
-
-# Global flag for graceful shutdown in worker processes
-_shutdown_requested = False
-
-
-def _worker_signal_handler(signum, frame):
-    """Signal handler for worker processes"""
-    global _shutdown_requested
-    _shutdown_requested = True
-    print(f"\n[Worker] Shutdown signal received, finishing current post...")
-
-
-
-def _extract_reel_tags(soup: BeautifulSoup, page: Page, url: str, worker_id: int, config: ScraperConfig) -> List[str]:
+from .exceptions import InstagramScraperError, RateLimitError
+from .post_data import (
+    PostData, _parse_likes_text, _wait_for_tag_popup,
+    _TAG_HREFS_XP, _TAG_USERNAMES_JS, _PROFILE_USERNAMES_JS, _POST_EXTRACT_JS, _post_extract_args
+)
+from .logger import setup_logger, setup_buffered_logger, flush_logger
+from .session_utils import parse_json_bytes
+
+# Optional: selectolax (Lexbor C parser) is much faster than lxml for post HTML
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# Precompiled XPaths for the parsed post HTML (first 2 like buttons of the
+# first <section>, first <time>); div._aa1y links use post_data._TAG_HREFS_XP
+_LIKES_SPANS_XP = etree.XPath('(//section)[1]/descendant::span[@role="button"][position() <= 2]')
+_TIME_XP = etree.XPath('(//time)[1]')
+
+# og:description starts with the like count: "1,234 likes, 56 comments - ..."
+_OG_LIKES_RE = re.compile(r'^(\d[\d.,]*[KMB]?)\s+likes?\b')
+
+# Post readiness: the post is rendered once a landmark (config.selector_post_ready:
+# timestamp / caption / like button) is in the DOM. 'tags' at once when tags and likes are both there;
+# otherwise graceMs after the landmark ('tags' or 'untagged'), so posts with
+# hidden like counts or no tags do not wait for elements that never come
+_POST_READY_JS = """([tagSelector, landmarkSelector, likesSelector, graceMs]) => {
+    if (!document.querySelector(landmarkSelector)) {
+        return false;
+    }
+    const tagged = !!document.querySelector(tagSelector);
+    if (tagged && document.querySelector(likesSelector)) {
+        return 'tags';
+    }
+    window.__instaharvestReadyAt = window.__instaharvestReadyAt || performance.now();
+    if (performance.now() - window.__instaharvestReadyAt < graceMs) {
+        return false;
+    }
+    return tagged ? 'tags' : 'untagged';
+}"""
+
+# Install locations of the Chrome/Edge release channels (same places Playwright
+# looks for channel='chrome' / 'msedge'); Windows entries are relative to the
+# LOCALAPPDATA / PROGRAMFILES / PROGRAMFILES(X86) directories
+_CHANNEL_EXECUTABLES = {
+    'chrome': {
+        'linux': ['/opt/google/chrome/chrome'],
+        'darwin': ['/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'],
+        'win32': [r'Google\Chrome\Application\chrome.exe'],
+    },
+    'msedge': {
+        'linux': ['/opt/microsoft/msedge/msedge'],
+        'darwin': ['/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge'],
+        'win32': [r'Microsoft\Edge\Application\msedge.exe'],
+    },
+}
+
+# Per-process worker state, set once by _init_worker when the pool starts the process
+_worker_config: Optional[ScraperConfig] = None
+_worker_shared: Dict[str, Any] = {}
+_worker_session: Optional[Dict[str, Any]] = None
+_worker_log: logging.Logger = logging.getLogger('ParallelWorker')  # Buffered once _init_worker runs
+_worker_own_browser: Optional['_SharedCDPBrowser'] = None  # Worker's own CDP browser (runs in its own session)
+
+
+
+def _extract_reel_tags(page: Page, url: str, worker_id: int, config: ScraperConfig) -> List[str]:
     """
     Extract tagged accounts from REEL via popup button (EXCLUDE comment section!)
 
@@ -38,82 +105,76 @@ def _extract_reel_tags(soup: BeautifulSoup, page: Page, url: str, worker_id: int
     Comment class: x5yr21d xw2csxc x1odjw0f x1n2onr6 - MUST BE EXCLUDED!
     """
     tagged = []
+    seen = set()  # O(1) membership; `tagged` keeps the order
 
     try:
         # METHOD 1: Click tag button to open popup
         tag_button = page.locator(config.selector_tag_button).first
         tag_button.click(timeout=config.tag_button_click_timeout)
-        print(f"[Worker {worker_id}] ✓ Clicked tag button, waiting for popup...")
-        time.sleep(config.popup_animation_delay)
-        time.sleep(config.popup_content_load_delay)
+        _worker_log.debug(f"[Worker {worker_id}] ✓ Clicked tag button, waiting for popup...")
+        _wait_for_tag_popup(page, config)
 
         # CRITICAL FIX: Extract usernames ONLY from popup container (NOT comment section!)
         # Popup class: x1cy8zhl x9f619 x78zum5 xl56j7k x2lwn1j xeuugli x47corl
-        print(f"[Worker {worker_id}] Looking for popup container...")
+        _worker_log.debug(f"[Worker {worker_id}] Looking for popup container...")
 
         # Find popup container
         popup_container = page.locator(config.selector_popup_containers[0]).first
 
         if popup_container.count() == 0:
-            print(f"[Worker {worker_id}] Popup container not found, trying alternative selectors...")
+            _worker_log.debug(f"[Worker {worker_id}] Popup container not found, trying alternative selectors...")
             # Alternative: role="dialog"
             popup_container = page.locator(config.selector_popup_dialog).first
 
-        # Extract links ONLY from within popup container
-        popup_links = popup_container.locator('a[href^="/"]').all()
-        print(f"[Worker {worker_id}] Found {len(popup_links)} links in popup")
-
-        for link in popup_links:
-            try:
-                href = link.get_attribute('href', timeout=config.attribute_timeout)
-                if href and href.startswith('/') and href.endswith('/') and href.count('/') == 2:
-                    username = href.strip('/').split('/')[-1]
+        # Extract profile links ONLY from within popup container (one evaluate)
+        usernames = popup_container.evaluate(_PROFILE_USERNAMES_JS) if popup_container.count() > 0 else []
+        _worker_log.debug(f"[Worker {worker_id}] Found {len(usernames)} profile links in popup")
 
-                    # Filter system paths
-                    if username in config.instagram_system_paths:
-                        continue
-
-                    if username not in tagged:
-                        tagged.append(username)
-                        print(f"[Worker {worker_id}] ✓ Added tag: {username}")
-            except:
+        for username in usernames:
+            # Filter system paths
+            if username in config.instagram_system_paths:
                 continue
 
+            if username not in seen:
+                seen.add(username)
+                tagged.append(username)
+                _worker_log.debug(f"[Worker {worker_id}] ✓ Added tag: {username}")
+
         # Close popup
         try:
             close_button = page.locator(config.selector_close_button).first
             close_button.click(timeout=config.popup_close_timeout)
-            print(f"[Worker {worker_id}] ✓ Closed tag popup")
+            _worker_log.debug(f"[Worker {worker_id}] ✓ Closed tag popup")
         except:
             pass
 
         if tagged:
-            print(f"[Worker {worker_id}] ✓ Found {len(tagged)} reel tags: {tagged}")
+            _worker_log.debug(f"[Worker {worker_id}] ✓ Found {len(tagged)} reel tags: {tagged}")
             return tagged
 
     except Exception as e:
-        print(f"[Worker {worker_id}] Reel tag extraction failed: {e}")
+        _worker_log.warning(f"[Worker {worker_id}] Reel tag extraction failed: {e}")
 
     # No tags found
-    print(f"[Worker {worker_id}] ⚠️ No tags in reel (or no tag button)")
+    _worker_log.warning(f"[Worker {worker_id}] ⚠️ No tags in reel (or no tag button)")
     return []
 
 
-def _extract_reel_likes(soup: BeautifulSoup, page: Page, worker_id: int, config: ScraperConfig) -> str:
+def _extract_reel_likes(page: Page, worker_id: int, config: ScraperConfig) -> str:
     """Extract likes from REEL using reel-specific selector"""
     try:
         # Reel likes selector
         likes_span = page.locator(config.selector_reel_likes + '[role="button"]').first
         likes_text = likes_span.inner_text(timeout=config.reel_likes_timeout).strip()
-        likes_clean = likes_text.replace(',', '')
-        print(f"[Worker {worker_id}] ✓ Reel likes: {likes_clean}")
-        return likes_clean
+        likes = _parse_likes_text(likes_text) or 'N/A'
+        _worker_log.debug(f"[Worker {worker_id}] ✓ Reel likes: {likes}")
+        return likes
     except Exception as e:
-        print(f"[Worker {worker_id}] Reel likes extraction failed: {e}")
+        _worker_log.warning(f"[Worker {worker_id}] Reel likes extraction failed: {e}")
         return 'N/A'
 
 
-def _extract_reel_timestamp(soup: BeautifulSoup, page: Page, worker_id: int, config: ScraperConfig) -> str:
+def _extract_reel_timestamp(page: Page, worker_id: int, config: ScraperConfig) -> str:
     """Extract timestamp from REEL"""
     try:
         # Method 1: time.x1p4m5qa element
@@ -122,137 +183,621 @@ def _extract_reel_timestamp(soup: BeautifulSoup, page: Page, worker_id: int, con
         # Try title attribute first
         title = time_elem.get_attribute('title', timeout=config.visibility_timeout)
         if title:
-            print(f"[Worker {worker_id}] ✓ Reel timestamp (title): {title}")
+            _worker_log.debug(f"[Worker {worker_id}] ✓ Reel timestamp (title): {title}")
             return title
 
         # Fallback to datetime attribute
         datetime_attr = time_elem.get_attribute('datetime', timeout=config.visibility_timeout)
         if datetime_attr:
-            print(f"[Worker {worker_id}] ✓ Reel timestamp (datetime): {datetime_attr}")
+            _worker_log.debug(f"[Worker {worker_id}] ✓ Reel timestamp (datetime): {datetime_attr}")
             return datetime_attr
 
     except Exception as e:
-        print(f"[Worker {worker_id}] Reel timestamp extraction failed: {e}")
+        _worker_log.warning(f"[Worker {worker_id}] Reel timestamp extraction failed: {e}")
 
     return 'N/A'
 
 
-def _worker_scrape_batch(args: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """
-    Worker function for multiprocessing - MUST be at module level
+def _channel_executable(channel: Optional[str]) -> Optional[str]:
+    """Path of an installed browser channel ('chrome', 'msedge'), None if unknown or not installed"""
+    platform = 'linux' if sys.platform.startswith('linux') else sys.platform
+    candidates = _CHANNEL_EXECUTABLES.get(channel or '', {}).get(platform, [])
+    if platform == 'win32':
+        roots = [os.environ.get(name) for name in ('LOCALAPPDATA', 'PROGRAMFILES', 'PROGRAMFILES(X86)')]
+        candidates = [os.path.join(root, path) for root in roots if root for path in candidates]
+    return next((path for path in candidates if os.path.exists(path)), None)
 
-    Args:
-        args: Dictionary with keys: links_batch, worker_id, session_data, config_dict, result_queue
 
-    Returns:
-        List of post/reel data dictionaries
+def _launch_browser(p, config: ScraperConfig):
+    """Launch config.browser_channel (real Chrome), or Playwright's bundled Chromium if it is not installed"""
+    try:
+        return p.chromium.launch(
+            channel=config.browser_channel,
+            headless=config.headless,
+            args=config.browser_args
+        )
+    except Exception as e:
+        _worker_log.debug(f"Browser channel '{config.browser_channel}' unavailable, using bundled Chromium: {e}")
+        return p.chromium.launch(
+            headless=config.headless,
+            args=config.browser_args
+        )
+
+
+class _SharedCDPBrowser:
     """
-    # Register signal handler for this worker process
-    signal.signal(signal.SIGINT, _worker_signal_handler)
-    signal.signal(signal.SIGTERM, _worker_signal_handler)
-
-    links_batch = args['links_batch']  # Changed: Now receives link dictionaries
-    worker_id = args['worker_id']
-    session_data = args['session_data']
-    config_dict = args['config_dict']
-    result_queue = args.get('result_queue')  # Optional queue for real-time results
-
-    # Reconstruct config from dict
-    config = ScraperConfig(
-        headless=config_dict['headless'],
-        viewport_width=config_dict['viewport_width'],
-        viewport_height=config_dict['viewport_height'],
-        user_agent=config_dict['user_agent'],
-        default_timeout=config_dict['default_timeout'],
-        popup_animation_delay=config_dict['popup_animation_delay'],
-        popup_content_load_delay=config_dict['popup_content_load_delay'],
-        error_recovery_delay_min=config_dict['error_recovery_delay_min'],
-        error_recovery_delay_max=config_dict['error_recovery_delay_max'],
-        post_open_delay=config_dict['post_open_delay'],
-        ui_element_load_delay=config_dict['ui_element_load_delay']
-    )
+    Single Chromium process shared by all parallel workers over CDP
 
-    batch_results = []
+    The main process owns the browser lifecycle; worker processes attach with
+    connect_over_cdp() and only create/destroy their own contexts, so N
+    workers cost one browser process instead of N. A worker also uses it for
+    its own browser when the shared one is disabled or unavailable.
+    """
 
-    # Each worker gets its own Playwright instance
-    with sync_playwright() as p:
-        browser = p.chromium.launch(
-            channel='chrome',
-            headless=config.headless
+    def __init__(self, config: ScraperConfig, logger, port: Optional[int] = None):
+        self.config = config
+        self.logger = logger
+        self.port = config.cdp_port if port is None else port  # 0 = any free port (known once started)
+        self.cdp_url = f'http://127.0.0.1:{self.port}'
+        self.process: Optional[subprocess.Popen] = None
+        self.user_data_dir: Optional[str] = None
+
+    def start(self) -> str:
+        """
+        Launch Chromium with remote debugging enabled
+
+        Returns:
+            CDP endpoint URL for workers to connect to
+        """
+        # Same browser as everywhere else (config.browser_channel, e.g. real Chrome);
+        # Playwright's bundled Chromium only if that channel is not installed.
+        # Playwright is only borrowed to locate its build; no instance stays
+        # alive in the parent while worker processes start
+        executable = _channel_executable(self.config.browser_channel)
+        if executable is None:
+            with sync_playwright() as p:
+                executable = p.chromium.executable_path
+            if not os.path.exists(executable):
+                raise InstagramScraperError(
+                    f"Browser channel '{self.config.browser_channel}' not found and no bundled Chromium installed"
+                )
+            self.logger.debug(f"Browser channel '{self.config.browser_channel}' not found, using bundled Chromium")
+
+        # A fixed port held by another browser would make workers attach to that
+        # browser (its profile and cookies) instead of ours
+        if self.port:
+            with socket.socket() as sock:
+                if sock.connect_ex(('127.0.0.1', self.port)) == 0:
+                    raise InstagramScraperError(f"Remote debugging port {self.port} is already in use")
+
+        self.user_data_dir = tempfile.mkdtemp(prefix='instaharvest-cdp-')
+        command = [
+            executable,
+            f'--remote-debugging-port={self.port}',
+            f'--user-data-dir={self.user_data_dir}',
+            *self.config.browser_args,
+            'about:blank'
+        ]
+        if self.config.headless:
+            command.insert(1, '--headless=new')
+
+        self.process = subprocess.Popen(
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True  # Ctrl+C must not kill the browser while workers finish
         )
 
-        context = browser.new_context(
-            storage_state=session_data,
+        # Wait until the DevTools endpoint accepts connections (with port 0,
+        # Chromium writes the port it picked to DevToolsActivePort first)
+        deadline = time.time() + self.config.cdp_startup_timeout
+        while time.time() < deadline:
+            if self.process.poll() is not None:
+                break
+            if not self.port:
+                self._read_active_port()
+            if self.port:
+                try:
+                    with urllib.request.urlopen(f'{self.cdp_url}/json/version', timeout=1):
+                        self.logger.info(f"🌐 Shared browser ready at {self.cdp_url}")
+                        return self.cdp_url
+                except OSError:
+                    pass
+            time.sleep(self.config.ui_element_load_delay)
+
+        self.close()
+        raise InstagramScraperError(f"Shared browser did not start on {self.cdp_url}")
+
+    def _read_active_port(self) -> None:
+        """Take the port Chromium picked for --remote-debugging-port=0 (no-op until it is written)"""
+        try:
+            with open(os.path.join(self.user_data_dir, 'DevToolsActivePort'), encoding='utf-8') as f:
+                port = int(f.readline().strip())
+        except (OSError, ValueError):
+            return
+        self.port = port
+        self.cdp_url = f'http://127.0.0.1:{port}'
+
+    def close(self) -> None:
+        """Terminate the browser process and remove its profile directory"""
+        if self.process is not None:
+            try:
+                self.process.terminate()
+                self.process.wait(timeout=5)
+            except Exception:
+                try:
+                    self.process.kill()
+                except Exception:
+                    pass
+            self.process = None
+
+        if self.user_data_dir:
+            shutil.rmtree(self.user_data_dir, ignore_errors=True)
+            self.user_data_dir = None
+
+
+class _PagePool:
+    """
+    Pool of pre-warmed (context, page) pairs owned by one worker process
+
+    Contexts are created up-front with the session already loaded and are
+    checked out per URL instead of being rebuilt per batch, so cookies and
+    the HTTP cache stay warm between posts. Each context is
+    recycled (closed and re-created) after `config.pages_per_context_recycle`
+    URLs to cap Playwright's memory growth on long runs.
+    """
+
+    def __init__(self, browser, config: ScraperConfig, size: int = 1, storage_state: Any = None):
+        self.browser = browser
+        self.config = config
+        self.storage_state = storage_state or config.session_file  # Parsed session dict, or the file path
+        self._slots: "queue.Queue" = queue.Queue()
+        self._uses: Dict[int, int] = {}
+
+        for _ in range(size):
+            self._slots.put(self._new_slot())
+
+    def _new_slot(self):
+        """Create a fresh context + page with the session loaded"""
+        context = self.browser.new_context(
+            storage_state=self.storage_state,
             viewport={
-                'width': config.viewport_width,
-                'height': config.viewport_height
+                'width': self.config.viewport_width,
+                'height': self.config.viewport_height
             },
-            user_agent=config.user_agent
+            user_agent=self.config.user_agent
         )
-
         page = context.new_page()
-        page.set_default_timeout(config.default_timeout)
+        page.set_default_timeout(self.config.default_timeout)
+
+        # Media blocked for the context's lifetime; the Instagram JS bundles
+        # fetched for the first post stay cached for the following ones
+        try:
+            _block_page_media(context, page, self.config.blocked_url_patterns)
+        except Exception:
+            pass
+
+        self._uses[id(context)] = 0
+        return context, page
+
+    def acquire(self):
+        """Check out a (context, page) pair, blocking until one is free"""
+        return self._slots.get()
+
+    def release(self, context, page) -> None:
+        """Return a pair to the pool, recycling its context when it is worn out"""
+        self._uses[id(context)] = self._uses.get(id(context), 0) + 1
+
+        if self._uses[id(context)] >= self.config.pages_per_context_recycle:
+            self._uses.pop(id(context), None)
+            try:
+                context.close()
+            except:
+                pass
+            context, page = self._new_slot()
+
+        self._slots.put((context, page))
+
+    def close(self) -> None:
+        """Close every pooled context"""
+        while True:
+            try:
+                context, _ = self._slots.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                context.close()
+            except:
+                pass
+        self._uses.clear()
+
+
+class _AdaptiveThrottle:
+    """
+    Per-worker pacing driven by how Instagram responds
+
+    Shared by all lanes of one worker process. Every navigation waits a
+    random base delay (config.throttle_base_delay_min..max). A 429, a
+    navigation timeout or a redirect to the login page doubles the penalty
+    on top of it (starting at config.throttle_min_delay, capped at
+    config.throttle_max_delay) and holds it for config.throttle_cooldown
+    seconds; after that it halves on every clean navigation until it drops
+    back to zero. When the median of the recent navigation times exceeds
+    config.throttle_target_rtt, the excess is added as extra spacing.
+    """
+
+    def __init__(self, config: ScraperConfig):
+        self.config = config
+        self._lock = threading.Lock()
+        self._rtts: deque = deque(maxlen=config.throttle_rtt_window)
+        self._penalty = 0.0
+        self._penalty_until = 0.0
+
+    def delay(self) -> float:
+        """Seconds to wait before the next navigation"""
+        with self._lock:
+            slowdown = 0.0
+            if len(self._rtts) >= 3:
+                slowdown = max(0.0, statistics.median(self._rtts) - self.config.throttle_target_rtt)
+            base = random.uniform(self.config.throttle_base_delay_min, self.config.throttle_base_delay_max)
+            return min(base + self._penalty + slowdown, self.config.throttle_max_delay)
+
+    def wait(self) -> None:
+        """Sleep for the current delay"""
+        pause = self.delay()
+        if pause > 0:
+            time.sleep(pause)
+
+    def record_success(self, rtt: float) -> None:
+        """Register a navigation that completed without being rate-limited"""
+        with self._lock:
+            self._rtts.append(rtt)
+            if self._penalty and time.time() >= self._penalty_until:
+                self._penalty /= 2
+                if self._penalty < self.config.throttle_min_delay:
+                    self._penalty = 0.0
+
+    def record_limited(self) -> None:
+        """Register a 429, a navigation timeout or a login redirect"""
+        with self._lock:
+            self._penalty = min(
+                max(self.config.throttle_min_delay, self._penalty * 2),
+                self.config.throttle_max_delay
+            )
+            self._penalty_until = time.time() + self.config.throttle_cooldown
+
+
+def _pin_worker_cpu(worker_slot) -> None:
+    """
+    Pin this worker process to one CPU core (Linux only, no-op elsewhere)
+
+    Cores are handed out round-robin from the cores this process may run on,
+    using a counter shared by all workers. A browser launched by the worker
+    afterwards inherits the same affinity.
+    """
+    if not hasattr(os, 'sched_setaffinity'):
+        return
+
+    with worker_slot.get_lock():
+        slot = worker_slot.value
+        worker_slot.value += 1
+
+    try:
+        cores = sorted(os.sched_getaffinity(0))
+        os.sched_setaffinity(0, {cores[slot % len(cores)]})
+    except OSError:
+        pass
+
+
+def _init_worker(config_dict: Dict[str, Any], shared: Dict[str, Any]) -> None:
+    """
+    Pool initializer - runs once per worker process
+
+    Receives the config and the shared queues once at process start, so each
+    submitted task only carries its worker id.
+
+    Args:
+        config_dict: ScraperConfig fields (must be serializable for multiprocessing)
+        shared: Dictionary with keys: task_queue, result_queue, stop_event, total_posts, cdp_url,
+            session_bytes, worker_slot
+    """
+    global _worker_config, _worker_shared, _worker_session, _worker_log
+
+    # The parent owns shutdown: Ctrl+C reaches the whole process group, so
+    # workers ignore it and stop cooperatively through shared['stop_event'].
+    # SIGTERM (pool terminate, kill) still ends the worker
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, _terminate_worker)
+
+    _worker_config = ScraperConfig(**config_dict)
+    _worker_shared = shared
+
+    # Progress lines are batched (worker_log_buffer records per write) instead
+    # of one stdout write per print; flushed when the worker finishes
+    _worker_log = setup_buffered_logger(
+        'ParallelWorker',
+        level=_worker_config.log_level,
+        capacity=_worker_config.worker_log_buffer
+    )
+
+    if _worker_config.pin_worker_cpus:
+        _pin_worker_cpu(shared['worker_slot'])
+
+    # Session file arrives as raw bytes (cheap to pickle) and is parsed once here,
+    # instead of every new context re-reading and re-parsing the file
+    _worker_session = parse_json_bytes(shared['session_bytes'])
+
+
+def _terminate_worker(signum, frame) -> None:
+    """SIGTERM handler (worker): close the worker's own browser, then terminate as usual"""
+    if _worker_own_browser is not None:
+        _worker_own_browser.close()
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    os.kill(os.getpid(), signal.SIGTERM)
+
+
+def _worker_scrape_batch(worker_id: int) -> List[Tuple[int, PostData]]:
+    """
+    Worker function for multiprocessing - MUST be at module level
+
+    Workers pull links from a shared task queue until it is drained, so a
+    slow post only delays the worker handling it instead of a whole
+    pre-sliced batch (no stragglers). Each worker runs
+    config.contexts_per_worker lanes (threads) against the same queue, all
+    attached over CDP to the shared browser (or to the worker's own one).
+
+    Args:
+        worker_id: Worker number (config and queues come from _init_worker)
+
+    Returns:
+        List of (index, PostData) pairs (posts and reels), index is 1-based link position
+    """
+    global _worker_own_browser
+
+    config = _worker_config
+    task_queue = _worker_shared['task_queue']  # Shared queue of (index, link_data) tuples
+    total_posts = _worker_shared['total_posts']
+    result_queue = _worker_shared.get('result_queue')  # Optional queue for real-time results
+    cdp_url = _worker_shared.get('cdp_url')  # Shared browser endpoint (None = launch own browser)
+    stop_event = _worker_shared.get('stop_event')  # Set by the parent to stop after the current post
+
+    # One throttle per worker: all lanes slow down together when Instagram pushes back
+    throttle = _AdaptiveThrottle(config)
+
+    # Without the shared browser, a worker that runs several lanes starts its
+    # own CDP Chromium (free port, or a fixed cdp_port offset by worker id) so all lanes attach to it
+    own_browser = None
+    if not cdp_url and config.contexts_per_worker > 1:
+        own_browser = _SharedCDPBrowser(
+            config,
+            _worker_log,
+            port=config.cdp_port + worker_id if config.cdp_port else 0
+        )
+        # Registered before start(): a SIGTERM during startup must not orphan it
+        _worker_own_browser = own_browser
+        try:
+            cdp_url = own_browser.start()
+        except Exception as e:
+            _worker_log.warning(f"[Worker {worker_id}] ⚠️ Own browser unavailable, running a single lane: {e}")
+            own_browser = _worker_own_browser = None
+
+    try:
+        lanes = config.contexts_per_worker if cdp_url else 1
+        if lanes <= 1:
+            batch_results = _scrape_from_queue(
+                task_queue, total_posts, worker_id, config, result_queue, cdp_url, stop_event, throttle
+            )
+        else:
+            # K lanes in this process, each with its own Playwright connection and
+            # context on the same browser, so K pages are in flight at once.
+            # Each lane fills its own list, so a crashed lane keeps what it finished
+            batch_results = []
+            lane_results = [[] for _ in range(lanes)]
+            with ThreadPoolExecutor(max_workers=lanes) as executor:
+                futures = [
+                    executor.submit(
+                        _scrape_from_queue, task_queue, total_posts, worker_id, config, result_queue, cdp_url, stop_event,
+                        throttle, results
+                    )
+                    for results in lane_results
+                ]
+                for lane, (future, results) in enumerate(zip(futures, lane_results), 1):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        # Links it never took stay queued for the other lanes
+                        _worker_log.error(f"[Worker {worker_id}] Lane {lane} crashed after {len(results)} posts: {e}")
+                    batch_results.extend(results)
+    finally:
+        if own_browser is not None:
+            own_browser.close()
+            _worker_own_browser = None
+        flush_logger(_worker_log)
+
+    # Sentinel: queued after all of this worker's results (crashes are reported by the parent)
+    if result_queue is not None:
+        result_queue.put({'type': 'worker_done', 'worker_id': worker_id})
+
+    return batch_results
+
+
+def _is_login_redirect(page: Page) -> bool:
+    """Whether Instagram sent the page to the login/signup form (a soft block)"""
+    return '/accounts/login' in page.url or '/accounts/emailsignup' in page.url
+
+
+def _throttled_goto(page: Page, url: str, config: ScraperConfig, throttle: Optional[_AdaptiveThrottle]):
+    """Navigate to url and feed the outcome (latency, 429, timeout, login redirect) to the throttle"""
+    started = time.time()
+    try:
+        response = page.goto(url, wait_until=config.post_navigation_wait_until, timeout=config.navigation_timeout)
+    except PlaywrightTimeoutError:
+        if throttle is not None:
+            throttle.record_limited()
+        raise
+
+    if throttle is not None:
+        if (response is not None and response.status == 429) or _is_login_redirect(page):
+            throttle.record_limited()
+        else:
+            throttle.record_success(time.time() - started)
+    return response
+
+
+def _report_worker_crash(future, worker_id: int, result_queue) -> None:
+    """Done-callback (parent process): send the sentinel for a worker that died before sending its own"""
+    if future.cancelled() or future.exception() is not None:
+        result_queue.put({'type': 'worker_done', 'worker_id': worker_id})
+
+
+def _scrape_from_queue(
+    task_queue,
+    total_posts: int,
+    worker_id: int,
+    config: ScraperConfig,
+    result_queue,
+    cdp_url: Optional[str],
+    stop_event=None,
+    throttle: Optional[_AdaptiveThrottle] = None,
+    batch_results: Optional[List[Tuple[int, PostData]]] = None
+) -> List[Tuple[int, PostData]]:
+    """
+    Scrape links from the shared task queue until it is drained (one lane)
+
+    Args:
+        task_queue: Shared queue of (index, link_data) tuples
+        total_posts: Total number of links (for progress logs)
+        worker_id: Worker number (for logs)
+        config: Worker configuration
+        result_queue: Optional queue for real-time results
+        cdp_url: Shared browser endpoint (None = launch own browser)
+        stop_event: Optional multiprocessing.Event; when set, the lane stops before its next link
+        throttle: Optional adaptive throttle shared by the lanes of this worker
+        batch_results: Optional list to append results to (still filled if the lane raises)
+
+    Returns:
+        List of (index, PostData) pairs scraped by this lane
+    """
+    if batch_results is None:
+        batch_results = []
+
+    # Each lane gets its own Playwright instance (sync API objects are thread-bound)
+    with sync_playwright() as p:
+        if cdp_url:
+            # Attach to the browser shared by all workers (contexts stay per worker)
+            browser = p.chromium.connect_over_cdp(cdp_url)
+        else:
+            # Own browser for this lane (config.browser_channel, bundled Chromium as fallback)
+            browser = _launch_browser(p, config)
+
+        # Pre-warmed contexts with the session already loaded
+        page_pool = _PagePool(browser, config, storage_state=_worker_session)
 
         try:
-            total_in_batch = len(links_batch)
-            for idx, link_data in enumerate(links_batch, 1):
+            while True:
+                # Cooperative shutdown requested by the parent (checked between posts)
+                if stop_event is not None and stop_event.is_set():
+                    _worker_log.info(f"[Worker {worker_id}] Shutdown requested, stopping...")
+                    break
+
+                # Work-stealing: take the next link whenever this worker is free
+                try:
+                    idx, link_data = task_queue.get(timeout=config.task_queue_timeout)
+                except queue.Empty:
+                    break
+
                 # Extract URL and content type
                 url = link_data['url']
                 content_type = link_data.get('type', 'Post')  # 'Post' or 'Reel'
                 is_reel = (content_type == 'Reel')
 
-                # Check for shutdown request
-                global _shutdown_requested
-                if _shutdown_requested:
-                    print(f"[Worker {worker_id}] Shutdown requested, stopping...")
-                    break
-
+                context = page = None
                 try:
+                    context, page = page_pool.acquire()
+
                     # LOG: Starting scrape with type
-                    print(f"[Worker {worker_id}] [{idx}/{total_in_batch}] 🔍 Scraping [{content_type}]: {url}")
+                    _worker_log.info(f"[Worker {worker_id}] [{idx}/{total_posts}] 🔍 Scraping [{content_type}]: {url}")
 
-                    # Navigate to post/reel
-                    page.goto(url, wait_until=config.page_load_wait_until, timeout=config.navigation_timeout)
-                    print(f"[Worker {worker_id}] [{idx}/{total_in_batch}] ✓ Page loaded")
+                    # Adaptive pacing: base delay, longer once Instagram answers with 429s or slows down
+                    if throttle is not None:
+                        throttle.wait()
 
-                    # CRITICAL: Wait longer for content to load
-                    time.sleep(config.post_open_delay)
+                    # Navigate to post/reel (only wait for the response to commit)
+                    response = _throttled_goto(page, url, config, throttle)
 
-                    # Get HTML content
-                    html_content = page.content()
-                    soup = BeautifulSoup(html_content, 'lxml')
+                    # Back off only when Instagram actually rate-limits us
+                    if response is not None and response.status == 429:
+                        backoff = max(config.retry_delay, throttle.delay() if throttle is not None else 0.0)
+                        _worker_log.warning(f"[Worker {worker_id}] [{idx}/{total_posts}] ⚠️ Rate limited (HTTP 429), backing off {backoff:.1f}s...")
+                        time.sleep(backoff)
+                        response = _throttled_goto(page, url, config, throttle)
+                        if response is not None and response.status == 429:
+                            raise RateLimitError(f"Rate limited (HTTP 429): {url}")
 
                     # Extract data based on content type
                     if is_reel:
+                        # Proceed as soon as the reel landmark (timestamp / like button) is rendered
+                        try:
+                            page.wait_for_selector(config.selector_post_ready, timeout=config.post_ready_timeout, state='attached')
+                            _worker_log.debug(f"[Worker {worker_id}] [{idx}/{total_posts}] ✓ Page loaded")
+                        except:
+                            _worker_log.warning(f"[Worker {worker_id}] [{idx}/{total_posts}] ⚠️ Post landmark not found, extracting anyway")
+
                         # REEL-specific extraction
-                        tagged_accounts = _extract_reel_tags(soup, page, url, worker_id, config)
-                        likes = _extract_reel_likes(soup, page, worker_id, config)
-                        timestamp = _extract_reel_timestamp(soup, page, worker_id, config)
+                        tagged_accounts = _extract_reel_tags(page, url, worker_id, config)
+                        likes = _extract_reel_likes(page, worker_id, config)
+                        timestamp = _extract_reel_timestamp(page, worker_id, config)
                     else:
                         # POST extraction (original logic)
-                        # Try to wait for tag elements specifically
+                        # One event-driven wait: returns as soon as tags and likes are rendered
+                        # (or post_tag_wait_timeout after the landmark if either never shows up)
                         try:
-                            page.wait_for_selector(config.selector_post_tag_container, timeout=config.post_tag_wait_timeout, state='attached')
-                            print(f"[Worker {worker_id}] [{idx}/{total_in_batch}] ✓ Tag elements detected")
+                            tags_ready = page.wait_for_function(
+                                _POST_READY_JS,
+                                arg=[
+                                    config.selector_post_tag_container,
+                                    config.selector_post_ready,
+                                    config.selector_post_like_button,
+                                    config.post_tag_wait_timeout
+                                ],
+                                timeout=config.post_ready_timeout + config.post_tag_wait_timeout
+                            ).json_value() == 'tags'
+                            if tags_ready:
+                                _worker_log.debug(f"[Worker {worker_id}] [{idx}/{total_posts}] ✓ Page loaded, tag elements detected")
+                            else:
+                                _worker_log.debug(f"[Worker {worker_id}] [{idx}/{total_posts}] ✓ Page loaded, no tag elements (might be normal)")
                         except:
-                            print(f"[Worker {worker_id}] [{idx}/{total_in_batch}] ⚠️ No tag elements (might be normal)")
-
-                        tagged_accounts = _extract_tags_robust(soup, page, url, worker_id, config)
-                        likes = _extract_likes_bs4(soup, page, config)
-                        timestamp = _extract_timestamp_bs4(soup)
-
-                    result = {
-                        'url': url,
-                        'tagged_accounts': tagged_accounts,
-                        'likes': likes,
-                        'timestamp': timestamp,
-                        'content_type': content_type  # Include content type in result
-                    }
-
-                    batch_results.append(result)
+                            _worker_log.warning(f"[Worker {worker_id}] [{idx}/{total_posts}] ⚠️ Post not fully rendered, extracting anyway")
+
+                        # Fast path: all three fields computed in-page, no HTML transfer or parse
+                        fields = _evaluate_post_fields(page, config)
+                        if fields is not None:
+                            tagged_accounts = fields['tags']
+                            likes = fields['likes']
+                            timestamp = fields['timestamp']
+                            _worker_log.debug(f"[Worker {worker_id}] [{idx}/{total_posts}] ✓ Extracted in-page: {tagged_accounts}")
+                        else:
+                            # One pass over the parsed tree for tags, likes and timestamp
+                            tree = _parse_post_html(page, config)
+                            fields = _extract_all(tree, config)
+                            tagged_accounts = _extract_tags_robust(tree, page, url, worker_id, config, fields['tags'])
+                            likes = fields['likes']
+                            if likes == 'N/A':
+                                likes = _extract_likes_og(tree, page, config)
+                            timestamp = fields['timestamp']
+
+                    result = PostData(
+                        url=url,
+                        tagged_accounts=tagged_accounts,
+                        likes=likes,
+                        timestamp=timestamp,
+                        content_type=content_type  # Include content type in result
+                    )
+
+                    batch_results.append((idx, result))
 
                     # LOG: Success
-                    print(f"[Worker {worker_id}] [{idx}/{total_in_batch}] ✅ DONE [{content_type}]: {len(tagged_accounts)} tags, {likes} likes")
+                    _worker_log.info(f"[Worker {worker_id}] [{idx}/{total_posts}] ✅ DONE [{content_type}]: {len(tagged_accounts)} tags, {likes} likes")
 
                     # REAL-TIME: Send to queue immediately for Excel writing
                     if result_queue is not None:
@@ -263,19 +808,16 @@ def _worker_scrape_batch(args: Dict[str, Any]) -> List[Dict[str, Any]]:
                             'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                         })
 
-                    # Small delay
-                    time.sleep(random.uniform(config.error_recovery_delay_min, config.error_recovery_delay_max))
-
                 except Exception as e:
-                    print(f"[Worker {worker_id}] [{idx}/{total_in_batch}] ❌ ERROR: {e}")
-                    error_result = {
-                        'url': url,
-                        'tagged_accounts': [],
-                        'likes': 'ERROR',
-                        'timestamp': 'N/A',
-                        'content_type': content_type  # Include content type even in errors
-                    }
-                    batch_results.append(error_result)
+                    _worker_log.error(f"[Worker {worker_id}] [{idx}/{total_posts}] ❌ ERROR: {e}")
+                    error_result = PostData(
+                        url=url,
+                        tagged_accounts=[],
+                        likes='ERROR',
+                        timestamp='N/A',
+                        content_type=content_type  # Include content type even in errors
+                    )
+                    batch_results.append((idx, error_result))
 
                     # Send error to queue too
                     if result_queue is not None:
@@ -286,12 +828,13 @@ def _worker_scrape_batch(args: Dict[str, Any]) -> List[Dict[str, Any]]:
                             'error': str(e)
                         })
 
+                finally:
+                    if page is not None:
+                        page_pool.release(context, page)
+
         finally:
             # Always cleanup browser resources
-            try:
-                context.close()
-            except:
-                pass
+            page_pool.close()
             try:
                 browser.close()
             except:
@@ -300,15 +843,26 @@ def _worker_scrape_batch(args: Dict[str, Any]) -> List[Dict[str, Any]]:
     return batch_results
 
 
-def _extract_tags_robust(soup: BeautifulSoup, page: Page, url: str, worker_id: int, config: ScraperConfig) -> List[str]:
+def _extract_tags_robust(
+    tree: Any,
+    page: Page,
+    url: str,
+    worker_id: int,
+    config: ScraperConfig,
+    parsed_tags: Optional[List[str]] = None
+) -> List[str]:
     """
     Extract tags from posts (handles both IMAGE and VIDEO posts)
 
     Instagram tag structure:
     - IMAGE posts: Tags in <div class="_aa1y"> containers
     - VIDEO posts: Tags in popup (click button, then extract from popup)
+
+    Args:
+        parsed_tags: div._aa1y tags already collected by _extract_all (skips the lxml re-scan)
     """
     tagged = []
+    seen = set()  # O(1) membership; `tagged` keeps the order
 
     # STEP 1: Detect if this is a VIDEO post or IMAGE post
     is_video_post = False
@@ -316,15 +870,15 @@ def _extract_tags_robust(soup: BeautifulSoup, page: Page, url: str, worker_id: i
         video_count = page.locator('video').count()
         if video_count > 0:
             is_video_post = True
-            print(f"[Worker {worker_id}] Detected VIDEO post")
+            _worker_log.debug(f"[Worker {worker_id}] Detected VIDEO post")
         else:
-            print(f"[Worker {worker_id}] Detected IMAGE post")
+            _worker_log.debug(f"[Worker {worker_id}] Detected IMAGE post")
     except:
         pass
 
     # STEP 2: If VIDEO post, use POPUP extraction (like reels)
     if is_video_post:
-        print(f"[Worker {worker_id}] Using VIDEO post tag extraction (popup method)...")
+        _worker_log.debug(f"[Worker {worker_id}] Using VIDEO post tag extraction (popup method)...")
         try:
             # Find and click tag button
             tag_button = page.locator(config.selector_tag_button).first
@@ -332,8 +886,7 @@ def _extract_tags_robust(soup: BeautifulSoup, page: Page, url: str, worker_id: i
             if tag_button.count() > 0:
                 # Click the tag button
                 tag_button.click(timeout=config.tag_button_click_timeout)
-                time.sleep(config.popup_animation_delay)
-                time.sleep(config.popup_content_load_delay)
+                _wait_for_tag_popup(page, config)
 
                 # CRITICAL: Extract from popup container ONLY
                 popup_container = page.locator(config.selector_popup_containers[0]).first
@@ -343,24 +896,16 @@ def _extract_tags_robust(soup: BeautifulSoup, page: Page, url: str, worker_id: i
                     popup_container = page.locator(config.selector_popup_dialog).first
 
                 if popup_container.count() > 0:
-                    # Extract links ONLY from popup
-                    popup_links = popup_container.locator('a[href^="/"]').all()
-
-                    for link in popup_links:
-                        try:
-                            href = link.get_attribute('href', timeout=config.attribute_timeout)
-                            if href and href.startswith('/') and href.endswith('/') and href.count('/') == 2:
-                                username = href.strip('/').split('/')[-1]
-
-                                # Filter out system paths
-                                if username in config.instagram_system_paths:
-                                    continue
-
-                                if username and username not in tagged:
-                                    tagged.append(username)
-                        except:
+                    # Extract profile links ONLY from popup (one evaluate)
+                    for username in popup_container.evaluate(_PROFILE_USERNAMES_JS):
+                        # Filter out system paths
+                        if username in config.instagram_system_paths:
                             continue
 
+                        if username and username not in seen:
+                            seen.add(username)
+                            tagged.append(username)
+
                     # Close popup
                     try:
                         close_button = page.locator(config.selector_close_button).first
@@ -369,11 +914,11 @@ def _extract_tags_robust(soup: BeautifulSoup, page: Page, url: str, worker_id: i
                         page.keyboard.press('Escape')
 
                 if tagged:
-                    print(f"[Worker {worker_id}] ✓ Found {len(tagged)} tags (VIDEO popup): {tagged}")
+                    _worker_log.debug(f"[Worker {worker_id}] ✓ Found {len(tagged)} tags (VIDEO popup): {tagged}")
                     return tagged
 
         except Exception as e:
-            print(f"[Worker {worker_id}] VIDEO popup extraction failed: {e}")
+            _worker_log.warning(f"[Worker {worker_id}] VIDEO popup extraction failed: {e}")
             # Try closing popup
             try:
                 page.keyboard.press('Escape')
@@ -381,108 +926,187 @@ def _extract_tags_robust(soup: BeautifulSoup, page: Page, url: str, worker_id: i
                 pass
 
     # STEP 3: If IMAGE post (or video extraction failed), use div._aa1y extraction
-    print(f"[Worker {worker_id}] Using IMAGE post tag extraction (div._aa1y method)...")
+    _worker_log.debug(f"[Worker {worker_id}] Using IMAGE post tag extraction (div._aa1y method)...")
 
-    # METHOD 1: BeautifulSoup - div._aa1y > a[href]
+    # METHOD 1: lxml - div._aa1y > a[href]
     try:
-        tag_containers = soup.find_all('div', class_='_aa1y')
-        for container in tag_containers:
-            link = container.find('a', href=True)
-            if link and link.get('href'):
-                href = link['href']
-                username = href.strip('/').split('/')[-1]
-
-                # Filter out system paths
-                if username in config.instagram_system_paths:
-                    continue
-
-                if username and username not in tagged:
-                    tagged.append(username)
+        if parsed_tags is None:
+            parsed_tags = _extract_all(tree, config)['tags']
+        for username in parsed_tags:
+            if username not in seen:
+                seen.add(username)
+                tagged.append(username)
 
         if tagged:
-            print(f"[Worker {worker_id}] ✓ Found {len(tagged)} tags (BS4 Method 1): {tagged}")
+            _worker_log.debug(f"[Worker {worker_id}] ✓ Found {len(tagged)} tags (lxml Method 1): {tagged}")
             return tagged
     except Exception as e:
-        print(f"[Worker {worker_id}] Method 1 failed: {e}")
+        _worker_log.warning(f"[Worker {worker_id}] Method 1 failed: {e}")
 
     # METHOD 2: Playwright - div._aa1y locator
     try:
-        tag_divs = page.locator(config.selector_post_tag_container).all()
-        for tag_div in tag_divs:
-            try:
-                link = tag_div.locator('a[href]').first
-                href = link.get_attribute('href', timeout=config.visibility_timeout)
-                if href:
-                    username = href.strip('/').split('/')[-1]
-
-                    # Filter out system paths
-                    if username in config.instagram_system_paths:
-                        continue
-
-                    if username and username not in tagged:
-                        tagged.append(username)
-            except:
+        # All containers' usernames in a single evaluate (one CDP round-trip)
+        for username in page.evaluate(_TAG_USERNAMES_JS, config.selector_post_tag_container):
+            # Filter out system paths
+            if username in config.instagram_system_paths:
                 continue
 
+            if username and username not in seen:
+                seen.add(username)
+                tagged.append(username)
+
         if tagged:
-            print(f"[Worker {worker_id}] ✓ Found {len(tagged)} tags (Playwright Method 2): {tagged}")
+            _worker_log.debug(f"[Worker {worker_id}] ✓ Found {len(tagged)} tags (Playwright Method 2): {tagged}")
             return tagged
     except Exception as e:
-        print(f"[Worker {worker_id}] Method 2 failed: {e}")
+        _worker_log.warning(f"[Worker {worker_id}] Method 2 failed: {e}")
 
     # ALL METHODS FAILED - Log warning
-    print(f"[Worker {worker_id}] ⚠️ WARNING: No tags found in {url}")
+    _worker_log.warning(f"[Worker {worker_id}] ⚠️ WARNING: No tags found in {url}")
     return ['No tags']
 
 
-def _extract_likes_bs4(soup: BeautifulSoup, page: Page, config: ScraperConfig) -> str:
-    """Extract likes using BeautifulSoup + fallback to Playwright"""
-    # Method 1: BS4 - span[role="button"]
+def _parse_post_html(page: Page, config: ScraperConfig) -> Any:
+    """Parse the post container HTML (full page as fallback) with selectolax, or lxml if not installed"""
+    try:
+        html_content = page.locator(config.selector_post_content).first.inner_html(timeout=config.post_content_timeout)
+    except:
+        html_content = page.content()
+    if SELECTOLAX_AVAILABLE:
+        return LexborHTMLParser(html_content)
+    return lxml_html.document_fromstring(html_content)
+
+
+def _evaluate_post_fields(page: Page, config: ScraperConfig) -> Optional[Dict[str, Any]]:
+    """
+    Extract tags, likes and timestamp inside the page with a single evaluate
+
+    Likes fall back to og:description (read in the same evaluate); missing
+    likes/timestamp are 'N/A' as on the HTML path.
+
+    Returns:
+        Dict with 'tags', 'likes' and 'timestamp', or None when no tags were
+        found, the tag containers were still attaching or the post is a video
+        (tags live in a popup) - the caller then falls back to the HTML path
+    """
     try:
-        section = soup.find('section')
-        if section:
-            spans = section.find_all('span', role='button')
-            for span in spans[:2]:
-                text = span.get_text(strip=True)
-                if text and text.replace(',', '').replace('.', '').replace('K', '').replace('M', '').isdigit():
-                    return text.replace(',', '')
-                if text and ('K' in text or 'M' in text):
-                    return text
+        raw = page.evaluate(_POST_EXTRACT_JS, _post_extract_args(config))
     except Exception:
-        pass
+        return None
+
+    if not raw['tagsStable']:
+        return None
+
+    tags = []
+    for username in raw['tags']:
+        # Filter out system paths
+        if username and username not in config.instagram_system_paths and username not in tags:
+            tags.append(username)
+    if not tags:
+        return None
+
+    likes = raw['likes']
+    if not likes:
+        match = _OG_LIKES_RE.match(raw['og'])
+        likes = match.group(1) if match else ''
+    return {
+        'tags': tags,
+        'likes': (_parse_likes_text(likes) or likes) if likes else 'N/A',
+        'timestamp': raw['timestamp'] or 'N/A'
+    }
+
+
+def _extract_all(tree: Any, config: ScraperConfig) -> Dict[str, Any]:
+    """
+    Extract tags, likes and timestamp from a post with precompiled XPaths
+    (or CSS selectors when the tree was parsed by selectolax)
+
+    All element matching runs inside libxml2; Python only touches the hits:
+    - div._aa1y > a[href]               -> tagged username
+    - first section span[role="button"] -> likes (first 2 spans checked)
+    - first <time>                      -> timestamp (title, datetime, text)
+
+    Returns:
+        Dict with 'tags' (list), 'likes' ('N/A' if not found) and 'timestamp' ('N/A' if not found)
+    """
+    if SELECTOLAX_AVAILABLE and isinstance(tree, LexborHTMLParser):
+        return _extract_all_selectolax(tree, config)
+
+    tags = []
+    likes = 'N/A'
+    timestamp = 'N/A'
 
-    # Method 2: Playwright fallback
     try:
-        section = page.locator('section').first
-        spans = section.locator('span[role="button"]').all()
-        for span in spans[:2]:
-            text = span.inner_text(timeout=config.visibility_timeout).strip()
-            if text and text.replace(',', '').isdigit():
-                return text.replace(',', '')
+        for href in _TAG_HREFS_XP(tree):
+            username = href.rstrip('/').rpartition('/')[2]
+            # Filter out system paths
+            if username and username not in config.instagram_system_paths and username not in tags:
+                tags.append(username)
+
+        for span in _LIKES_SPANS_XP(tree):
+            parsed = _parse_likes_text(span.text_content().strip())
+            if parsed:
+                likes = parsed
+                break
+
+        time_elements = _TIME_XP(tree)
+        if time_elements:
+            el = time_elements[0]
+            timestamp = el.get('title') or el.get('datetime') or el.text_content().strip()
     except Exception:
         pass
 
-    return 'N/A'
+    return {'tags': tags, 'likes': likes, 'timestamp': timestamp}
+
 
+def _extract_all_selectolax(tree: Any, config: ScraperConfig) -> Dict[str, Any]:
+    """Same as _extract_all, for a selectolax (Lexbor) tree"""
+    tags = []
+    likes = 'N/A'
+    timestamp = 'N/A'
 
-def _extract_timestamp_bs4(soup: BeautifulSoup) -> str:
-    """Extract timestamp using BeautifulSoup"""
     try:
-        time_element = soup.find('time')
-        if time_element:
-            # Try title attribute
-            title = time_element.get('title')
-            if title:
-                return title
+        for container in tree.css(config.selector_post_tag_container):
+            link = container.css_first('a[href]')
+            href = link.attributes.get('href') if link is not None else None
+            if href:
+                username = href.rstrip('/').rpartition('/')[2]
+                # Filter out system paths
+                if username and username not in config.instagram_system_paths and username not in tags:
+                    tags.append(username)
+
+        for span in tree.css(config.selector_post_like_button)[:2]:
+            parsed = _parse_likes_text(span.text(strip=True))
+            if parsed:
+                likes = parsed
+                break
+
+        el = tree.css_first('time')
+        if el is not None:
+            timestamp = el.attributes.get('title') or el.attributes.get('datetime') or el.text(strip=True)
+    except Exception:
+        pass
 
-            # Try datetime attribute
-            datetime_str = time_element.get('datetime')
-            if datetime_str:
-                return datetime_str
+    return {'tags': tags, 'likes': likes, 'timestamp': timestamp}
 
-            # Fallback to text
-            return time_element.get_text(strip=True)
 
+def _extract_likes_og(tree: Any, page: Page, config: ScraperConfig) -> str:
+    """Extract likes from the og:description meta (fallback when the post HTML has none)"""
+    try:
+        if SELECTOLAX_AVAILABLE and isinstance(tree, LexborHTMLParser):
+            meta = tree.css_first(config.selector_og_description)
+            content = meta.attributes.get('content') if meta is not None else None
+        else:
+            meta = tree.find('.//meta[@property="og:description"]')
+            content = meta.get('content') if meta is not None else None
+        if meta is None:
+            # Parsed snapshot is the post container only; <head> meta is read directly
+            content = page.locator(config.selector_og_description).first.get_attribute(
+                'content', timeout=config.attribute_timeout
+            )
+        match = _OG_LIKES_RE.match(content or '')
+        if match:
+            return _parse_likes_text(match.group(1))
     except Exception:
         pass
 
@@ -494,8 +1118,9 @@ class ParallelPostDataScraper:
     Parallel post data scraper using multiple browser processes
 
     Features:
-    - Multiple independent browser processes (multiprocessing)
-    - BeautifulSoup for faster HTML parsing
+    - Multiple independent worker processes (multiprocessing)
+    - One shared browser over CDP, several contexts (pages in flight) per worker
+    - lxml for fast HTML parsing
     - Process-safe operations
     - True parallel execution (not limited by Python GIL)
     - Progress tracking
@@ -523,7 +1148,9 @@ class ParallelPostDataScraper:
 
         Args:
             post_links: List of dictionaries with 'url' and 'type' keys
-            parallel: Number of parallel contexts (default 1 = sequential)
+            parallel: Number of parallel workers (default 1 = sequential); each runs
+                config.contexts_per_worker contexts, so parallel x contexts_per_worker
+                pages are in flight
             session_file: Session file path
             excel_exporter: Optional Excel exporter for real-time writing
 
@@ -537,25 +1164,14 @@ class ParallelPostDataScraper:
             f"{parallel} parallel contexts"
         )
 
-        # Load session
-        import json
-        with open(session_file, 'r') as f:
-            session_data = json.load(f)
-
         # Sequential (parallel=1)
         if parallel <= 1:
-            # Extract URLs for sequential scraping
-            urls = [link['url'] for link in post_links]
-            return self._scrape_sequential(urls, session_data)
+            return self._scrape_sequential(post_links)
 
-        # Parallel (parallel > 1)
-        return self._scrape_parallel(post_links, session_data, parallel, excel_exporter)
+        # Parallel (parallel > 1): workers get the raw session file and parse it once each
+        return self._scrape_parallel(post_links, session_file, parallel, excel_exporter)
 
-    def _scrape_sequential(
-        self,
-        post_links: List[Dict[str, str]],
-        session_data: dict
-    ) -> List[PostData]:
+    def _scrape_sequential(self, post_links: List[Dict[str, str]]) -> List[PostData]:
         """Sequential scraping (original method)"""
         from .post_data import PostDataScraper
 
@@ -570,10 +1186,19 @@ class ParallelPostDataScraper:
 
         return results
 
+    def _flush_excel(self, excel_exporter, pending_rows: List[Dict[str, Any]]) -> None:
+        """Write buffered results to Excel in one call and clear the buffer"""
+        try:
+            excel_exporter.add_multiple_rows(pending_rows)
+            self.logger.info(f"  ✓ Saved {len(pending_rows)} posts to Excel")
+        except Exception as e:
+            self.logger.error(f"  ✗ Excel write failed: {e}")
+        pending_rows.clear()
+
     def _scrape_parallel(
         self,
         post_links: List[Dict[str, str]],  # Changed: Now accepts dictionaries
-        session_data: dict,
+        session_file: str,
         num_workers: int,
         excel_exporter=None
     ) -> List[PostData]:
@@ -582,19 +1207,23 @@ class ParallelPostDataScraper:
 
         Args:
             post_links: List of dictionaries with 'url' and 'type' keys
-            session_data: Session data
+            session_file: Session file path (read once, parsed once per worker)
             num_workers: Number of parallel workers
             excel_exporter: Optional Excel exporter for real-time writing
 
         Returns:
             List of PostData objects
         """
-        # Split link dictionaries into batches
-        batches = self._split_into_batches(post_links, num_workers)
+        # Never start more workers than there are links to scrape
+        num_workers = max(1, min(num_workers, len(post_links)))
 
         # Prepare config as dict (must be serializable for multiprocessing)
         config_dict = {
+            'session_file': os.path.abspath(session_file),
             'headless': self.config.headless,
+            'browser_channel': self.config.browser_channel,
+            'browser_args': list(self.config.browser_args),
+            'blocked_url_patterns': list(self.config.blocked_url_patterns),
             'viewport_width': self.config.viewport_width,
             'viewport_height': self.config.viewport_height,
             'user_agent': self.config.user_agent,
@@ -604,46 +1233,117 @@ class ParallelPostDataScraper:
             'error_recovery_delay_min': self.config.error_recovery_delay_min,
             'error_recovery_delay_max': self.config.error_recovery_delay_max,
             'post_open_delay': self.config.post_open_delay,
-            'ui_element_load_delay': self.config.ui_element_load_delay
+            'ui_element_load_delay': self.config.ui_element_load_delay,
+            'post_tag_stable_delay': self.config.post_tag_stable_delay,
+            'selector_tag_button': self.config.selector_tag_button,
+            'selector_post_tag_container': self.config.selector_post_tag_container,
+            'selector_post_ready': self.config.selector_post_ready,
+            'selector_post_like_button': self.config.selector_post_like_button,
+            'selector_post_content': self.config.selector_post_content,
+            'selector_og_description': self.config.selector_og_description,
+            'selector_popup_dialog': self.config.selector_popup_dialog,
+            'selector_popup_containers': list(self.config.selector_popup_containers),
+            'selector_close_button': self.config.selector_close_button,
+            'selector_reel_likes': self.config.selector_reel_likes,
+            'selector_reel_timestamp': self.config.selector_reel_timestamp,
+            'pages_per_context_recycle': self.config.pages_per_context_recycle,
+            'contexts_per_worker': self.config.contexts_per_worker,
+            'task_queue_timeout': self.config.task_queue_timeout,
+            'retry_delay': self.config.retry_delay,
+            'throttle_base_delay_min': self.config.throttle_base_delay_min,
+            'throttle_base_delay_max': self.config.throttle_base_delay_max,
+            'throttle_min_delay': self.config.throttle_min_delay,
+            'throttle_max_delay': self.config.throttle_max_delay,
+            'throttle_cooldown': self.config.throttle_cooldown,
+            'throttle_target_rtt': self.config.throttle_target_rtt,
+            'throttle_rtt_window': self.config.throttle_rtt_window,
+            'cdp_port': self.config.cdp_port,
+            'cdp_startup_timeout': self.config.cdp_startup_timeout,
+            'pin_worker_cpus': self.config.pin_worker_cpus,
+            'log_level': self.config.log_level,
+            'worker_log_buffer': self.config.worker_log_buffer
         }
 
-        # Create Manager Queue for real-time communication
-        manager = Manager()
-        result_queue = manager.Queue()
-
-        # Prepare arguments for each worker
-        worker_args = [
-            {
-                'links_batch': batch,  # Changed: Now passing link dictionaries
-                'worker_id': i,
-                'session_data': session_data,
-                'config_dict': config_dict,
-                'result_queue': result_queue  # Pass queue to workers
-            }
-            for i, batch in enumerate(batches, 1)
-        ]
+        # Read the session once; bytes pickle as a single buffer per worker
+        with open(session_file, 'rb') as f:
+            session_bytes = f.read()
+
+        # Direct pipe-backed queues (no Manager server process): shared task queue
+        # (work-stealing) + real-time results; handed to workers via the pool initializer
+        task_queue = Queue()
+        result_queue = Queue()
+
+        # Every link is queued individually so any idle worker picks up the next one
+        for idx, link_data in enumerate(post_links, 1):
+            task_queue.put((idx, link_data))
+
+        # State every worker process receives once through the pool initializer
+        shared = {
+            'task_queue': task_queue,  # Shared queue of (index, link_data)
+            'result_queue': result_queue,  # Pass queue to workers
+            'stop_event': Event(),  # Cooperative shutdown (workers ignore SIGINT)
+            'total_posts': len(post_links),
+            'cdp_url': None,
+            'session_bytes': session_bytes,  # Raw session file, parsed once per worker
+            'worker_slot': Value('i', 0)  # Next CPU slot for pin_worker_cpus
+        }
+
+        # One browser process for all workers (falls back to a browser per worker)
+        shared_browser = None
+        if self.config.parallel_shared_browser:
+            shared_browser = _SharedCDPBrowser(self.config, self.logger)
+            try:
+                shared['cdp_url'] = shared_browser.start()
+            except Exception as e:
+                self.logger.warning(f"Shared browser unavailable, each worker launches its own: {e}")
+                shared_browser = None
 
         self.logger.info(
             f"Starting {num_workers} parallel processes for {len(post_links)} posts/reels"
         )
         self.logger.info("Real-time monitoring enabled ✓")
 
-        # Use multiprocessing Pool with async
-        results = []
+        # Worker processes via ProcessPoolExecutor; results stream over the queue, futures are collected at the end
+        # Results land at their link's position; gaps are filled with N/A below
+        sorted_results: List[Optional[PostData]] = [None] * len(post_links)
         completed_count = 0
         total_posts = len(post_links)
+        pending_rows = []  # Results waiting for the next batched Excel write
+        last_flush = time.time()
 
-        with Pool(processes=num_workers) as pool:
-            # Start workers asynchronously
-            async_result = pool.map_async(_worker_scrape_batch, worker_args)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=num_workers,
+                initializer=_init_worker,
+                initargs=(config_dict, shared)
+            ) as executor:
+                # Start workers asynchronously
+                futures = {
+                    executor.submit(_worker_scrape_batch, worker_id): worker_id
+                    for worker_id in range(1, num_workers + 1)
+                }
+                for future, worker_id in futures.items():
+                    future.add_done_callback(
+                        lambda f, worker_id=worker_id: _report_worker_crash(f, worker_id, result_queue)
+                    )
+
+                # REAL-TIME: Block on the queue until every worker has sent its sentinel
+                workers_done = 0
+                while workers_done < num_workers:
+                    try:
+                        message = result_queue.get()
+                    except KeyboardInterrupt:
+                        if shared['stop_event'].is_set():
+                            raise
+                        # First Ctrl+C: workers finish their current post, results keep draining
+                        self.logger.warning("⚠️ Interrupted - finishing current posts (Ctrl+C again to abort)")
+                        shared['stop_event'].set()
+                        continue
 
-            # REAL-TIME: Monitor queue while workers are running
-            while not async_result.ready() or not result_queue.empty():
-                try:
-                    # Non-blocking queue check
-                    message = result_queue.get(timeout=0.5)
+                    if message['type'] == 'worker_done':
+                        workers_done += 1
 
-                    if message['type'] == 'post_result':
+                    elif message['type'] == 'post_result':
                         # SUCCESS: Post scraped
                         data = message['data']
                         worker_id = message['worker_id']
@@ -651,22 +1351,12 @@ class ParallelPostDataScraper:
 
                         self.logger.info(
                             f"📦 [{completed_count}/{total_posts}] Worker {worker_id} completed: "
-                            f"{len(data['tagged_accounts'])} tags, {data['likes']} likes"
+                            f"{len(data.tagged_accounts)} tags, {data.likes} likes"
                         )
 
-                        # REAL-TIME Excel write
+                        # REAL-TIME Excel write (buffered, flushed below)
                         if excel_exporter:
-                            try:
-                                excel_exporter.add_row(
-                                    post_url=data['url'],
-                                    tagged_accounts=data['tagged_accounts'],
-                                    likes=data['likes'],
-                                    post_date=data['timestamp'],
-                                    content_type=data.get('content_type', 'Post')
-                                )
-                                self.logger.info(f"  ✓ Saved to Excel: {data['url']}")
-                            except Exception as e:
-                                self.logger.error(f"  ✗ Excel write failed: {e}")
+                            pending_rows.append(data.to_dict())
 
                     elif message['type'] == 'post_error':
                         # ERROR: Post failed
@@ -679,63 +1369,50 @@ class ParallelPostDataScraper:
                             f"❌ [{completed_count}/{total_posts}] Worker {worker_id} failed: {url} - {error}"
                         )
 
-                except:
-                    # Queue empty or timeout - continue
-                    time.sleep(self.config.ui_element_load_delay)
-
-            # Get final results from workers
-            batch_results_list = async_result.get()
-
-            # Flatten results
-            for batch_results in batch_results_list:
-                for result_dict in batch_results:
-                    results.append(PostData(
-                        url=result_dict['url'],
-                        tagged_accounts=result_dict['tagged_accounts'],
-                        likes=result_dict['likes'],
-                        timestamp=result_dict['timestamp'],
-                        content_type=result_dict.get('content_type', 'Post')  # Include content_type
-                    ))
-
-        # Sort results by original URL order
-        results_dict = {r.url: r for r in results}
-        sorted_results = [
-            results_dict.get(
-                link['url'],
-                PostData(
+                    # Adaptive batching: write at once while the backlog is small,
+                    # group rows into one write while results pile up
+                    if pending_rows and (
+                        len(pending_rows) >= self.config.excel_flush_rows
+                        or time.time() - last_flush >= self.config.excel_flush_interval
+                        or result_queue.empty()
+                    ):
+                        self._flush_excel(excel_exporter, pending_rows)
+                        last_flush = time.time()
+
+                # Collect final results: (index, PostData) pairs go straight to their slot
+                for future, worker_id in futures.items():
+                    try:
+                        batch_results = future.result()
+                        for idx, post in batch_results:
+                            sorted_results[idx - 1] = post
+                        self.logger.info(f"[Worker {worker_id}] done: {len(batch_results)} posts")
+                    except Exception as e:
+                        # Its unfinished posts are filled with N/A below
+                        self.logger.error(f"[Worker {worker_id}] crashed: {e}")
+
+                if pending_rows:
+                    self._flush_excel(excel_exporter, pending_rows)
+        finally:
+            if shared_browser is not None:
+                shared_browser.close()
+            # After an early stop (Ctrl+C, crashed worker) links are left in the task
+            # queue; its feeder thread must not hold up interpreter exit flushing them
+            task_queue.cancel_join_thread()
+
+        # Links no worker finished (crash / shutdown) get placeholder entries
+        for i, post in enumerate(sorted_results):
+            if post is None:
+                link = post_links[i]
+                sorted_results[i] = PostData(
                     url=link['url'],
                     tagged_accounts=[],
                     likes='N/A',
                     timestamp='N/A',
                     content_type=link.get('type', 'Post')
                 )
-            )
-            for link in post_links  # Changed: Now iterating over link dictionaries
-        ]
 
         self.logger.info(
             f"✅ Parallel scraping complete: {len(sorted_results)} posts"
         )
 
         return sorted_results
-
-    def _split_into_batches(
-        self,
-        items: List[str],
-        num_batches: int
-    ) -> List[List[str]]:
-        """Split list into roughly equal batches"""
-        batch_size = len(items) // num_batches
-        remainder = len(items) % num_batches
-
-        batches = []
-        start = 0
-
-        for i in range(num_batches):
-            # Add extra item to first 'remainder' batches
-            size = batch_size + (1 if i < remainder else 0)
-            end = start + size
-            batches.append(items[start:end])
-            start = end
-
-        return batches
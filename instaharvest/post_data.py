@@ -8,11 +8,16 @@ PROFESSIONAL VERSION with:
 - Performance monitoring
 """
 
+import re
 import time
+import atexit
 import random
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass, asdict
+import threading
+from collections import OrderedDict, deque
+from typing import List, Optional, Dict, Any, Tuple, Iterator
+from dataclasses import dataclass, replace
 from pathlib import Path
+from lxml import etree, html as lxml_html
 
 from .base import BaseScraper
 from .config import ScraperConfig
@@ -20,6 +25,202 @@ from .exceptions import HTMLStructureChangedError
 from .diagnostics import HTMLDiagnostics, run_diagnostic_mode
 from .error_handler import ErrorHandler
 from .performance import PerformanceMonitor
+from .session_utils import dump_json_bytes
+
+# Optional: selectolax (Lexbor C parser) parses post HTML much faster than lxml
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+
+# Likes text: a digit, then digits/separators, optional K/M/B suffix (e.g. "1,234", "12.5K", "1.2B")
+_LIKES_RE = re.compile(r'^(\d[\d.,]*)([KMB]?)$')
+
+# Shortcode from /p/<code>/, /reel/<code>/, /reels/<code>/ or /tv/<code>/ URLs
+_SHORTCODE_RE = re.compile(r'/(?:p|reels?|tv)/([A-Za-z0-9_-]+)')
+
+
+def _shortcode(url: str) -> Optional[str]:
+    """Shortcode of a post/reel URL (None if the URL has none)"""
+    match = _SHORTCODE_RE.search(url)
+    return match.group(1) if match else None
+
+
+def _tag_hrefs_from_html(html: str, container_selector: str) -> List[str]:
+    """First link href of every tag container in an HTML snapshot (selectolax, or lxml if not installed)"""
+    if SELECTOLAX_AVAILABLE:
+        hrefs = []
+        for container in LexborHTMLParser(html).css(container_selector):
+            link = container.css_first('a[href]')
+            if link is not None:
+                hrefs.append(link.attributes.get('href') or '')
+        return hrefs
+    return _TAG_HREFS_XP(lxml_html.document_fromstring(html))
+
+
+# Thousands separators dropped from plain like counts in one pass ("1,234" -> "1234")
+_STRIP_COMMAS = str.maketrans('', '', ',')
+
+
+def _parse_likes_text(text: str) -> Optional[str]:
+    """Likes value for a span text in one regex pass ("1,234" -> "1234", "12.5K"/"1.2B" kept), None if not a count"""
+    match = _LIKES_RE.match(text)
+    if match is None:
+        return None
+    return text if match.group(2) else match.group(1).translate(_STRIP_COMMAS)
+
+
+# First link of every div._aa1y tag container (class token match, like the CSS selector)
+_TAG_HREFS_XP = etree.XPath(
+    '//div[contains(concat(" ", normalize-space(@class), " "), " _aa1y ")]'
+    '/descendant::a[@href][1]/@href'
+)
+
+# In-page extraction (one round-trip instead of one per element)
+# Usernames of the first link in every tag container, in page order
+_TAG_USERNAMES_JS = """(containerSelector) => [...document.querySelectorAll(containerSelector)]
+    .map(div => div.querySelector('a[href]'))
+    .filter(Boolean)
+    .map(a => a.getAttribute('href').replace(/\\/+$/, '').split('/').pop())"""
+
+# In-page extractor: tags, likes and timestamp in one CDP round-trip (no HTML transfer).
+# tagsStable: the tag icon is there and the tag container count held for settleMs
+# (containers still attaching, or a video post's popup tags, leave it false)
+_POST_EXTRACT_JS = """async ([contentSelector, ogSelector, tagSelector, iconSelector, likesSelector, settleMs]) => {
+    const root = document.querySelector(contentSelector) || document;
+    const icon = document.querySelector(iconSelector) !== null;
+    const video = document.querySelector('video') !== null;
+    const count = root.querySelectorAll(tagSelector).length;
+    let tagsStable = false;
+    if (icon && !video && count > 0) {
+        await new Promise(resolve => setTimeout(resolve, settleMs));
+        tagsStable = root.querySelectorAll(tagSelector).length === count;
+    }
+    const tags = [...root.querySelectorAll(tagSelector)]
+        .map(div => div.querySelector('a[href]'))
+        .filter(Boolean)
+        .map(a => a.getAttribute('href').replace(/\\/+$/, '').split('/').pop());
+    const time = root.querySelector('time');
+    const timestamp = time
+        ? (time.getAttribute('title') || time.getAttribute('datetime') || time.textContent.trim())
+        : '';
+    const spans = [...root.querySelectorAll(likesSelector)].slice(0, 2).map(span => span.textContent.trim());
+    const likes = spans.find(text => /^\\d[\\d.,]*[KMB]?$/.test(text)) || '';
+    const og = document.querySelector(ogSelector);
+    return {
+        tags, likes, timestamp, icon, video, tagsStable,
+        og: og ? (og.getAttribute('content') || '') : ''
+    };
+}"""
+
+# get_tagged_accounts probe: tag icon, <video> and tag container usernames in one pass
+_TAG_PROBE_JS = """([iconSelector, containerSelector]) => ({
+    icon: document.querySelector(iconSelector) !== null,
+    video: document.querySelector('video') !== null,
+    tags: [...document.querySelectorAll(containerSelector)]
+        .map(div => div.querySelector('a[href]'))
+        .filter(Boolean)
+        .map(a => a.getAttribute('href').replace(/\\/+$/, '').split('/').pop())
+})"""
+
+# Profile usernames linked inside an element (href="/username/" only)
+_PROFILE_USERNAMES_JS = """(root) => [...root.querySelectorAll('a[href^="/"]')]
+    .map(a => a.getAttribute('href'))
+    .filter(href => href.endsWith('/') && href.split('/').length === 3)
+    .map(href => href.slice(1, -1))"""
+
+# Likes Method 4: number span of every span whose text mentions "likes" (like :has-text)
+_LIKES_MENTION_TEXTS_JS = """(spanSelector) => [...document.querySelectorAll('span')]
+    .filter(span => span.textContent.toLowerCase().includes('likes'))
+    .map(span => span.querySelector(spanSelector))
+    .filter(Boolean)
+    .map(span => span.innerText.trim())"""
+
+# Same usernames, inside the first element matching dialogSelector (whole page if none)
+_POPUP_USERNAMES_JS = """(dialogSelector) => [...(document.querySelector(dialogSelector) || document)
+    .querySelectorAll('a[href^="/"]')]
+    .map(a => a.getAttribute('href'))
+    .filter(href => href.endsWith('/') && href.split('/').length === 3)
+    .map(href => href.slice(1, -1))"""
+
+# Likes candidates of get_likes_count Methods 1-3 in one pass: the first two
+# like buttons (likes, comments), the class-based likes span in the first
+# <section>, and the span of the /liked_by/ link (old structure)
+_LIKES_TEXTS_JS = """([likesSelector, spanSelector, buttonSelector]) => {
+    const section = document.querySelector('section');
+    const classBased = section ? section.querySelector(likesSelector) : null;
+    const likedBy = document.querySelector('a[href*="/liked_by/"]');
+    const linkBased = likedBy ? likedBy.querySelector(spanSelector) : null;
+    return {
+        buttons: [...document.querySelectorAll(buttonSelector)].slice(0, 2).map(span => span.innerText.trim()),
+        classBased: classBased ? classBased.innerText.trim() : '',
+        linkBased: linkBased ? linkBased.innerText.trim() : ''
+    };
+}"""
+
+# Trimmed texts of the first `limit` elements matching selector (inside the first
+# rootSelector match if given)
+_ELEMENT_TEXTS_JS = """([selector, limit, rootSelector]) => {
+    const root = rootSelector ? document.querySelector(rootSelector) : document;
+    return root
+        ? [...root.querySelectorAll(selector)].slice(0, limit).map(el => el.innerText.trim())
+        : [];
+}"""
+
+# Resolves true as soon as the selector matches (woken by DOM mutations, no polling),
+# false after the timeout
+_WAIT_ATTACHED_JS = """([selector, timeout]) => new Promise(resolve => {
+    if (document.querySelector(selector)) return resolve(true);
+    const observer = new MutationObserver(() => {
+        if (document.querySelector(selector)) {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve(true);
+        }
+    });
+    const timer = setTimeout(() => { observer.disconnect(); resolve(false); }, timeout);
+    observer.observe(document, {childList: true, subtree: true});
+})"""
+
+
+def _tag_icon_selector(config: ScraperConfig) -> str:
+    """Selector of the Tags icon inside config.selector_tag_button"""
+    return config.selector_tag_button.replace('button:has(', '').replace(')', '')
+
+
+def _post_extract_args(config: ScraperConfig) -> List[Any]:
+    """Arguments for _POST_EXTRACT_JS"""
+    return [
+        config.selector_post_content,
+        config.selector_og_description,
+        config.selector_post_tag_container,
+        _tag_icon_selector(config),
+        config.selector_post_like_button,
+        config.post_tag_stable_delay
+    ]
+
+
+def _wait_for_tag_popup(page, config: ScraperConfig) -> bool:
+    """
+    Wait until the tag popup opened by the tag button shows its profile links
+
+    Replaces the fixed animation + content sleeps: returns as soon as a link is
+    visible, and never waits longer than those sleeps used to take
+    (popup_animation_delay + popup_content_load_delay).
+
+    Returns:
+        True if the popup links are visible
+    """
+    timeout = (config.popup_animation_delay + config.popup_content_load_delay) * 1000
+    try:
+        page.locator(f'{config.selector_popup_dialog} a[href^="/"]').first.wait_for(
+            state='visible', timeout=timeout
+        )
+        return True
+    except Exception:
+        return False
 
 
 @dataclass
@@ -32,8 +233,66 @@ class PostData:
     content_type: str = 'Post'  # 'Post' or 'Reel'
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        return asdict(self)
+        """Convert to dictionary (flat fields, so no recursive asdict() walk)"""
+        return {
+            'url': self.url,
+            'tagged_accounts': list(self.tagged_accounts),
+            'likes': self.likes,
+            'timestamp': self.timestamp,
+            'content_type': self.content_type
+        }
+
+
+class _BrowserPool:
+    """
+    Logged-in (playwright, browser, context) entries kept alive between
+    scrape_multiple calls, keyed by session file
+
+    Holds at most config.browser_pool_size entries (least recently used is
+    closed first); whatever is left is closed at interpreter exit. Sync
+    Playwright objects are bound to the thread that created them, so pooled
+    entries are only reused from that thread.
+    """
+
+    def __init__(self):
+        self._entries: "OrderedDict[str, Tuple[Any, Any, Any, int]]" = OrderedDict()
+
+    def checkout(self, session_file: str) -> Optional[Tuple[Any, Any, Any]]:
+        """Take the pooled entry for session_file (None if there is no usable one)"""
+        entry = self._entries.pop(session_file, None)
+        if entry is None:
+            return None
+        playwright, browser, context, thread_id = entry
+        if thread_id != threading.get_ident() or not browser.is_connected():
+            self._close(playwright, browser, context)
+            return None
+        return playwright, browser, context
+
+    def checkin(self, session_file: str, playwright, browser, context, max_size: int) -> None:
+        """Return an entry to the pool, closing the least recently used ones beyond max_size"""
+        self._entries[session_file] = (playwright, browser, context, threading.get_ident())
+        self._entries.move_to_end(session_file)
+        while len(self._entries) > max_size:
+            _, (old_playwright, old_browser, old_context, _) = self._entries.popitem(last=False)
+            self._close(old_playwright, old_browser, old_context)
+
+    def close_all(self) -> None:
+        """Close every pooled browser"""
+        while self._entries:
+            _, (playwright, browser, context, _) = self._entries.popitem()
+            self._close(playwright, browser, context)
+
+    @staticmethod
+    def _close(playwright, browser, context) -> None:
+        for closer in (context.close, browser.close, playwright.stop):
+            try:
+                closer()
+            except Exception:
+                pass
+
+
+_browser_pool = _BrowserPool()
+atexit.register(_browser_pool.close_all)
 
 
 class PostDataScraper(BaseScraper):
@@ -67,6 +326,7 @@ class PostDataScraper(BaseScraper):
         self.performance_monitor = PerformanceMonitor(self.logger)
         self.diagnostics = None  # Will be initialized when page is ready
         self.enable_diagnostics = enable_diagnostics
+        self._burst_left = self.config.post_burst_size  # Short delays left before the next long pause
 
         self.logger.info("✨ PostDataScraper ready (Professional Mode)")
 
@@ -96,83 +356,226 @@ class PostDataScraper(BaseScraper):
         """
         # Start performance monitoring
         with self.performance_monitor.measure(f"scrape_{self._get_content_type(post_url)}"):
-            # Detect content type
-            is_reel = self._is_reel(post_url)
-            content_type = 'Reel' if is_reel else 'Post'
-
-            self.logger.info(f"🎯 Scraping {content_type}: {post_url}")
+            self.logger.info(f"🎯 Scraping {'Reel' if self._is_reel(post_url) else 'Post'}: {post_url}")
 
-            # Navigate to post/reel
-            self.goto_url(post_url)
+            # Navigate to post/reel (no fixed delay: we wait for the post itself below)
+            self.goto_url(post_url, delay=0)
 
             # CRITICAL: Wait for content to load
-            time.sleep(self.config.post_open_delay)
+            self._wait_for_post_ready()
 
-            # Initialize diagnostics if page is ready
-            if self.enable_diagnostics and self.diagnostics is None:
-                self.diagnostics = HTMLDiagnostics(self.page, self.logger)
+            return self._extract_current_page(
+                post_url,
+                get_tags=get_tags,
+                get_likes=get_likes,
+                get_timestamp=get_timestamp
+            )
 
-            # Run diagnostics to detect HTML structure changes
-            if self.enable_diagnostics and self.diagnostics:
-                try:
-                    if is_reel:
-                        report = self.diagnostics.diagnose_reel(post_url)
-                    else:
-                        report = self.diagnostics.diagnose_post(post_url)
+    def _scrape_prefetched(
+        self,
+        post_url: str,
+        *,
+        get_tags: bool = True,
+        get_likes: bool = True,
+        get_timestamp: bool = True
+    ) -> PostData:
+        """
+        Scrape a post/reel that scrape_multiple already navigated self.page to
 
-                    if report.overall_status == 'FAILED':
-                        self.logger.critical(
-                            f"❌ CRITICAL HTML STRUCTURE CHANGE DETECTED!\n"
-                            f"   {', '.join(report.recommendations)}"
-                        )
-                    elif report.overall_status == 'PARTIAL':
-                        self.logger.warning(
-                            f"⚠️ Some HTML selectors may have changed: "
-                            f"{report.get_success_rate():.1f}% success rate"
-                        )
-                except Exception as e:
-                    self.logger.debug(f"Diagnostics failed: {e}")
+        Args:
+            post_url: URL of the post/reel
+            get_tags: Extract tagged accounts
+            get_likes: Extract likes count
+            get_timestamp: Extract post timestamp
 
-            # Extract data based on type with error recovery
-            if is_reel:
-                tagged_accounts = self._extract_with_recovery(
-                    self.get_reel_tagged_accounts, 'reel_tags'
-                ) if get_tags else []
+        Returns:
+            PostData object
+        """
+        if '/accounts/login' in self.page.url:
+            # Redirected to login: the regular navigation attempts session recovery
+            return self.scrape(
+                post_url,
+                get_tags=get_tags,
+                get_likes=get_likes,
+                get_timestamp=get_timestamp
+            )
 
-                likes = self._extract_with_recovery(
-                    self.get_reel_likes_count, 'reel_likes', default='N/A'
-                ) if get_likes else 'N/A'
+        with self.performance_monitor.measure(f"scrape_{self._get_content_type(post_url)}"):
+            self.logger.info(f"🎯 Scraping {'Reel' if self._is_reel(post_url) else 'Post'}: {post_url}")
 
-                timestamp = self._extract_with_recovery(
-                    self.get_reel_timestamp, 'reel_timestamp', default='N/A'
-                ) if get_timestamp else 'N/A'
-            else:
-                tagged_accounts = self._extract_with_recovery(
-                    self.get_tagged_accounts, 'post_tags'
-                ) if get_tags else []
-
-                likes = self._extract_with_recovery(
-                    self.get_likes_count, 'post_likes', default='N/A'
-                ) if get_likes else 'N/A'
-
-                timestamp = self._extract_with_recovery(
-                    self.get_timestamp, 'post_timestamp', default='N/A'
-                ) if get_timestamp else 'N/A'
-
-            data = PostData(
-                url=post_url,
-                tagged_accounts=tagged_accounts,
-                likes=likes,
-                timestamp=timestamp,
-                content_type=content_type
-            )
+            # The page has been loading in the background; usually the landmark is already there
+            self._wait_for_post_ready()
 
-            self.logger.info(
-                f"✅ Extracted [{content_type}]: {len(data.tagged_accounts)} tags, "
-                f"{data.likes} likes, {data.timestamp}"
+            return self._extract_current_page(
+                post_url,
+                get_tags=get_tags,
+                get_likes=get_likes,
+                get_timestamp=get_timestamp
             )
 
-            return data
+    def _wait_for_post_ready(self) -> None:
+        """Wait until the post/reel landmark (timestamp or like button) is in the DOM"""
+        if not self._wait_attached(self.config.selector_post_ready, self.config.post_ready_timeout):
+            self.logger.debug("Post landmark not found, extracting anyway")
+
+    def _wait_attached(self, selector: str, timeout: int) -> bool:
+        """
+        Wait until selector matches an element in the page (MutationObserver, no polling)
+
+        Args:
+            selector: CSS selector
+            timeout: Max wait in milliseconds
+
+        Returns:
+            True if the element is attached, False on timeout
+        """
+        try:
+            return self.page.evaluate(_WAIT_ATTACHED_JS, [selector, timeout])
+        except Exception:
+            # The document was replaced mid-wait (navigation): use Playwright's waiter
+            try:
+                self.page.wait_for_selector(selector, state='attached', timeout=timeout)
+                return True
+            except Exception:
+                return False
+
+    def _prefetch_post(self, page, post_url: str) -> bool:
+        """
+        Start loading a post/reel in a spare page (returns once the response commits)
+
+        Returns:
+            False if navigation failed (the post is then scraped with the
+            regular navigation and retries)
+        """
+        try:
+            page.goto(post_url, wait_until='commit', timeout=self.config.navigation_timeout)
+            return True
+        except Exception as e:
+            self.logger.debug(f"Prefetch failed for {post_url}: {e}")
+            return False
+
+    def _extract_current_page(
+        self,
+        post_url: str,
+        *,
+        get_tags: bool = True,
+        get_likes: bool = True,
+        get_timestamp: bool = True
+    ) -> PostData:
+        """Run diagnostics and extract data from the post/reel loaded in self.page"""
+        is_reel = self._is_reel(post_url)
+        content_type = 'Reel' if is_reel else 'Post'
+
+        # Initialize diagnostics if page is ready (scrape_multiple rotates pages)
+        if self.enable_diagnostics and self.diagnostics is None:
+            self.diagnostics = HTMLDiagnostics(self.page, self.logger)
+        elif self.diagnostics is not None:
+            self.diagnostics.page = self.page
+
+        # Run diagnostics to detect HTML structure changes
+        if self.enable_diagnostics and self.diagnostics:
+            try:
+                if is_reel:
+                    report = self.diagnostics.diagnose_reel(post_url)
+                else:
+                    report = self.diagnostics.diagnose_post(post_url)
+
+                if report.overall_status == 'FAILED':
+                    self.logger.critical(
+                        f"❌ CRITICAL HTML STRUCTURE CHANGE DETECTED!\n"
+                        f"   {', '.join(report.recommendations)}"
+                    )
+                elif report.overall_status == 'PARTIAL':
+                    self.logger.warning(
+                        f"⚠️ Some HTML selectors may have changed: "
+                        f"{report.get_success_rate():.1f}% success rate"
+                    )
+            except Exception as e:
+                self.logger.debug(f"Diagnostics failed: {e}")
+
+        # Extract data based on type with error recovery
+        if is_reel:
+            tagged_accounts = self._extract_with_recovery(
+                self.get_reel_tagged_accounts, 'reel_tags'
+            ) if get_tags else []
+
+            likes = self._extract_with_recovery(
+                self.get_reel_likes_count, 'reel_likes', default='N/A'
+            ) if get_likes else 'N/A'
+
+            timestamp = self._extract_with_recovery(
+                self.get_reel_timestamp, 'reel_timestamp', default='N/A'
+            ) if get_timestamp else 'N/A'
+        else:
+            # One in-page snapshot first; the per-field methods only run for what it missed
+            snapshot = self._post_snapshot() if (get_tags or get_likes or get_timestamp) else {}
+
+            if not get_tags:
+                tagged_accounts = []
+            elif snapshot.get('tags'):
+                tagged_accounts = snapshot['tags']
+            else:
+                tagged_accounts = self._extract_with_recovery(self.get_tagged_accounts, 'post_tags')
+
+            if not get_likes:
+                likes = 'N/A'
+            elif snapshot.get('likes'):
+                likes = snapshot['likes']
+            else:
+                likes = self._extract_with_recovery(self.get_likes_count, 'post_likes', default='N/A')
+
+            if not get_timestamp:
+                timestamp = 'N/A'
+            elif snapshot.get('timestamp'):
+                timestamp = snapshot['timestamp']
+            else:
+                timestamp = self._extract_with_recovery(self.get_timestamp, 'post_timestamp', default='N/A')
+
+        data = PostData(
+            url=post_url,
+            tagged_accounts=tagged_accounts,
+            likes=likes,
+            timestamp=timestamp,
+            content_type=content_type
+        )
+
+        self.logger.info(
+            f"✅ Extracted [{content_type}]: {len(data.tagged_accounts)} tags, "
+            f"{data.likes} likes, {data.timestamp}"
+        )
+
+        return data
+
+    def _post_snapshot(self) -> Dict[str, Any]:
+        """
+        Tags, likes and timestamp of the loaded post read in a single evaluate
+
+        Returns:
+            Dict with whatever was found ('tags' list, 'likes', 'timestamp');
+            tags are only included when the post has no tag icon or its tag
+            containers are settled, otherwise get_tagged_accounts() reads them
+            (video posts keep theirs in the tag popup)
+        """
+        try:
+            raw = self.page.evaluate(_POST_EXTRACT_JS, _post_extract_args(self.config))
+        except Exception as e:
+            self.logger.debug(f"Post snapshot failed: {e}")
+            return {}
+
+        snapshot: Dict[str, Any] = {}
+        if not raw['icon']:
+            # No tag icon: the post has no tags (same check as get_tagged_accounts)
+            snapshot['tags'] = [self.config.default_no_tags_text]
+        elif raw['tagsStable']:
+            tagged: Dict[str, None] = {}
+            for username in raw['tags']:
+                # Filter out system paths
+                if username and username not in self.config.instagram_system_paths:
+                    tagged[username] = None
+            snapshot['tags'] = list(tagged)
+        snapshot['likes'] = _parse_likes_text(raw['likes']) if raw['likes'] else None
+        snapshot['timestamp'] = raw['timestamp']
+        return snapshot
 
     def _get_content_type(self, url: str) -> str:
         """Helper to get content type from URL"""
@@ -203,10 +606,18 @@ class PostDataScraper(BaseScraper):
         get_tags: bool = True,
         get_likes: bool = True,
         get_timestamp: bool = True,
-        delay_between_posts: bool = True
+        delay_between_posts: bool = True,
+        concurrency: Optional[int] = None
     ) -> List[PostData]:
         """
-        Scrape multiple posts sequentially - PROFESSIONAL VERSION
+        Scrape multiple posts - PROFESSIONAL VERSION
+
+        Up to `concurrency` posts load at once in separate pages of the same
+        (logged-in) context: while one post is being extracted, the next ones
+        are already loading, so page load time overlaps with extraction and
+        the rate-limiting delay. Extraction itself stays one page at a time.
+        For large jobs see iter_scrape() / scrape_to_jsonl(), which do not
+        keep all results in memory.
 
         Args:
             post_urls: List of post URLs
@@ -214,6 +625,7 @@ class PostDataScraper(BaseScraper):
             get_likes: Extract likes count
             get_timestamp: Extract post timestamp
             delay_between_posts: Add delay between posts (rate limiting)
+            concurrency: Posts loading at once (default: config.post_scrape_concurrency)
 
         Returns:
             List of PostData objects
@@ -221,83 +633,405 @@ class PostDataScraper(BaseScraper):
         self.logger.info(f"📦 Scraping {len(post_urls)} posts/reels...")
         self.performance_monitor.log_system_info()
 
-        # Load session and setup browser
+        by_index: Dict[int, PostData] = {}
+        start_time = time.time()
+
+        for i, data in self._iter_scrape_indexed(
+            post_urls,
+            get_tags=get_tags,
+            get_likes=get_likes,
+            get_timestamp=get_timestamp,
+            delay_between_posts=delay_between_posts,
+            concurrency=concurrency
+        ):
+            by_index[i] = data
+
+        results = [by_index[i] for i in range(1, len(post_urls) + 1)]
+
+        # Print final statistics
+        total_time = time.time() - start_time
+        success_count = sum(1 for r in results if r.likes != 'ERROR')
+        posts_count = sum(1 for r in results if r.content_type == 'Post' and r.likes != 'ERROR')
+        reels_count = sum(1 for r in results if r.content_type == 'Reel' and r.likes != 'ERROR')
+
+        self.logger.info(
+            f"\n{'='*70}\n"
+            f"📊 SCRAPING COMPLETE - STATISTICS\n"
+            f"{'='*70}\n"
+            f"Total URLs: {len(post_urls)}\n"
+            f"Successfully scraped: {success_count}/{len(post_urls)} "
+            f"({(success_count/len(post_urls)*100):.1f}%)\n"
+            f"  - Posts: {posts_count}\n"
+            f"  - Reels: {reels_count}\n"
+            f"Failed: {len(post_urls) - success_count}\n"
+            f"Total time: {total_time:.2f}s\n"
+            f"Average time per item: {total_time/len(post_urls):.2f}s\n"
+            f"{'='*70}"
+        )
+
+        # Print performance report
+        self.performance_monitor.print_report()
+
+        # Print error statistics
+        self.error_handler.print_stats()
+
+        return results
+
+    def iter_scrape(
+        self,
+        post_urls: List[str],
+        *,
+        get_tags: bool = True,
+        get_likes: bool = True,
+        get_timestamp: bool = True,
+        delay_between_posts: bool = True,
+        concurrency: Optional[int] = None
+    ) -> Iterator[PostData]:
+        """
+        Scrape multiple posts, yielding each result as soon as it is ready
+
+        Same pipeline as scrape_multiple() without holding the results: posts
+        answered by the media API come first, browser-scraped ones follow
+        (posts before reels, each group in input order). Failed posts yield
+        the usual ERROR placeholder.
+
+        Args:
+            post_urls: List of post URLs
+            get_tags: Extract tagged accounts
+            get_likes: Extract likes count
+            get_timestamp: Extract post timestamp
+            delay_between_posts: Add delay between posts (rate limiting)
+            concurrency: Posts loading at once (default: config.post_scrape_concurrency)
+
+        Yields:
+            PostData objects
+        """
+        for _, data in self._iter_scrape_indexed(
+            post_urls,
+            get_tags=get_tags,
+            get_likes=get_likes,
+            get_timestamp=get_timestamp,
+            delay_between_posts=delay_between_posts,
+            concurrency=concurrency
+        ):
+            yield data
+
+    def scrape_to_jsonl(self, post_urls: List[str], path: str, **kwargs) -> int:
+        """
+        Scrape multiple posts straight into a JSON Lines file (one object per post)
+
+        Args:
+            post_urls: List of post URLs
+            path: Output .jsonl file (overwritten)
+            **kwargs: Options of iter_scrape()
+
+        Returns:
+            Number of lines written
+        """
+        count = 0
+        with open(path, 'wb', buffering=1 << 16) as f:
+            for data in self.iter_scrape(post_urls, **kwargs):
+                f.write(dump_json_bytes(data.to_dict()) + b'\n')
+                count += 1
+
+        self.logger.info(f"💾 {count} posts/reels written to {path}")
+        return count
+
+    def _iter_scrape_indexed(
+        self,
+        post_urls: List[str],
+        *,
+        get_tags: bool,
+        get_likes: bool,
+        get_timestamp: bool,
+        delay_between_posts: bool,
+        concurrency: Optional[int]
+    ) -> Iterator[Tuple[int, PostData]]:
+        """Yield (1-based index, PostData) pairs; repeated URLs are scraped once"""
+        # Positions of every post in the input, keyed by shortcode so that
+        # /p/<code>/ and /p/<code>/?utm_source=... count as the same post
+        positions: Dict[str, List[int]] = {}
+        unique_urls = []
+        for i, url in enumerate(post_urls, 1):
+            key = _shortcode(url) or url
+            if key not in positions:
+                positions[key] = []
+                unique_urls.append(url)
+            positions[key].append(i)
+
+        if len(unique_urls) < len(post_urls):
+            self.logger.info(f"🔁 {len(post_urls) - len(unique_urls)} duplicate URLs skipped")
+
+        for j, data in self._iter_scrape_unique(
+            unique_urls,
+            get_tags=get_tags,
+            get_likes=get_likes,
+            get_timestamp=get_timestamp,
+            delay_between_posts=delay_between_posts,
+            concurrency=concurrency
+        ):
+            # Duplicates share the scraped values of their first occurrence,
+            # each under its own URL and content type
+            url = unique_urls[j - 1]
+            for i in positions[_shortcode(url) or url]:
+                yield i, replace(
+                    data,
+                    url=post_urls[i - 1],
+                    tagged_accounts=list(data.tagged_accounts),
+                    content_type='Reel' if self._is_reel(post_urls[i - 1]) else 'Post'
+                )
+
+    def _iter_scrape_unique(
+        self,
+        post_urls: List[str],
+        *,
+        get_tags: bool,
+        get_likes: bool,
+        get_timestamp: bool,
+        delay_between_posts: bool,
+        concurrency: Optional[int]
+    ) -> Iterator[Tuple[int, PostData]]:
+        """Yield (1-based index, PostData) pairs: media API answers first, then the browser"""
+        # Check if browser is already setup (SharedBrowser mode)
+        is_shared_browser = self.page is not None and self.browser is not None
+
+        # Load session
         session_data = self.load_session()
-        self.setup_browser(session_data)
 
-        results = []
-        start_time = time.time()
+        # One burst/pause sequence (_next_post_delay) spans the API and browser passes
+        self._burst_left = self.config.post_burst_size
+
+        try:
+            # Fast path: posts the JSON media API answers never open a page.
+            # Paced like browser navigations unless delays are off (then concurrent)
+            pending = list(enumerate(post_urls, 1))
+            if self.config.post_api_fast_path:
+                from .fast_post import FastPostScraper
+                fast = FastPostScraper(self.config, session_data, self.logger)
+                pacing = (lambda: self._next_post_delay(0)) if delay_between_posts else None
+                pending = []
+                for (i, url), data in zip(enumerate(post_urls, 1), fast.iter_fetch(post_urls, pacing)):
+                    if data is None:
+                        pending.append((i, url))
+                        continue
+                    if not get_tags:
+                        data.tagged_accounts = []
+                    if not get_likes:
+                        data.likes = 'N/A'
+                    if not get_timestamp:
+                        data.timestamp = 'N/A'
+                    yield i, data
+                self.logger.info(f"⚡ {len(post_urls) - len(pending)}/{len(post_urls)} fetched via media API")
+
+            # Everything else goes through the browser: posts first, reels after, so
+            # the reels' tag popup clicks do not hold up the cheaper posts
+            pending.sort(key=lambda link: self._is_reel(link[1]))
+            if pending:
+                if is_shared_browser:
+                    self.logger.debug("Using existing browser session (SharedBrowser mode)")
+                else:
+                    self._acquire_browser(session_data)
+                yield from self._scrape_in_pages(
+                    pending,
+                    len(post_urls),
+                    get_tags=get_tags,
+                    get_likes=get_likes,
+                    get_timestamp=get_timestamp,
+                    delay_between_posts=delay_between_posts,
+                    concurrency=concurrency
+                )
+
+        finally:
+            # Only release the browser if not in SharedBrowser mode
+            if not is_shared_browser:
+                self._release_browser()
+            else:
+                self.logger.debug("Keeping browser open (SharedBrowser mode)")
+
+    def _acquire_browser(self, session_data: Dict[str, Any]) -> None:
+        """Reuse the pooled logged-in browser for this session file, or set up a new one"""
+        entry = _browser_pool.checkout(self.config.session_file) if self.config.browser_pool_size > 0 else None
+        if entry is None:
+            self.setup_browser(session_data)
+            return
+
+        self.playwright, self.browser, self.context = entry
+        self.page = self.context.new_page()
+        self.page.set_default_timeout(self.config.default_timeout)
+        self.logger.info("♻️ Reusing pooled browser")
+
+    def _release_browser(self) -> None:
+        """Put the browser back into the pool (session saved first), or close it"""
+        if self.config.browser_pool_size <= 0 or self.context is None:
+            self.close()
+            return
+
+        # A failed session write must not keep the browser from going back to the pool
+        try:
+            self.update_session()
+        except Exception as e:
+            self.logger.warning(f"Failed to update session before pooling the browser: {e}")
+        try:
+            self.page.close()
+        except Exception:
+            pass
+        _browser_pool.checkin(
+            self.config.session_file, self.playwright, self.browser, self.context,
+            self.config.browser_pool_size
+        )
+        self.page = None
+        self.context = None
+        self.browser = None
+        self.playwright = None
+        self.logger.info("Browser kept open for the next batch")
+
+    def _next_post_delay(self, consecutive_failures: int) -> float:
+        """
+        Seconds to wait before starting the next post
+
+        Bursts of config.post_burst_size short delays followed by one long
+        pause, closer to how people browse than a constant delay (plain
+        post_scrape_delay range when post_burst_size is 0). Consecutive
+        failed posts add an exponential backoff on top.
+        """
+        if self.config.post_burst_size > 0:
+            if self._burst_left > 0:
+                self._burst_left -= 1
+                delay = random.uniform(self.config.post_burst_delay_min, self.config.post_burst_delay_max)
+            else:
+                self._burst_left = self.config.post_burst_size
+                delay = random.uniform(self.config.post_burst_pause_min, self.config.post_burst_pause_max)
+        else:
+            delay = random.uniform(self.config.post_scrape_delay_min, self.config.post_scrape_delay_max)
+
+        if consecutive_failures:
+            delay += min(
+                self.config.post_failure_backoff_base ** consecutive_failures,
+                self.config.post_failure_backoff_max
+            )
+        return delay
+
+    def _scrape_in_pages(
+        self,
+        links: List[Tuple[int, str]],
+        total: int,
+        *,
+        get_tags: bool,
+        get_likes: bool,
+        get_timestamp: bool,
+        delay_between_posts: bool,
+        concurrency: Optional[int]
+    ) -> Iterator[Tuple[int, PostData]]:
+        """
+        Scrape links in the browser, keeping up to `concurrency` of them loading at once
+
+        Args:
+            links: (index, url) pairs, index is the 1-based position in the full list
+            total: Total number of links (for progress logs)
+
+        Yields:
+            (index, PostData) pairs in link order
+        """
+        concurrency = max(1, min(concurrency or self.config.post_scrape_concurrency, len(links)))
+        main_page = self.page
+        pages = [main_page]
+        consecutive_failures = 0
+        main_cdp = self._block_media(main_page)
 
         try:
-            for i, url in enumerate(post_urls, 1):
+            for _ in range(concurrency - 1):
+                page = self.context.new_page()
+                page.set_default_timeout(self.config.default_timeout)
+                self._block_media(page)
+                pages.append(page)
+
+            # Freed pages whose next navigation is held back by the rate-limiting
+            # delay; meanwhile the posts already loading are extracted
+            waiting = deque()  # (due, page, (index, url))
+            last_due = 0.0
+
+            # First link loads now; the other pages' first links are spaced out
+            # like every later navigation instead of all starting at once
+            links = iter(links)
+            in_flight = deque()  # (index, url, page, prefetched)
+            for n, (page, link) in enumerate(zip(pages, links)):
+                if n == 0:
+                    in_flight.append((link[0], link[1], page, self._prefetch_post(page, link[1])))
+                    continue
+                delay = self._next_post_delay(0) if delay_between_posts else 0.0
+                last_due = max(time.monotonic(), last_due) + delay
+                waiting.append((last_due, page, link))
+
+            while in_flight or waiting:
+                # Start the navigations that are due (sleep only when nothing else is loaded)
+                while waiting and (not in_flight or time.monotonic() >= waiting[0][0]):
+                    due, page, (next_i, next_url) = waiting.popleft()
+                    pause = due - time.monotonic()
+                    if pause > 0:
+                        self.logger.debug(f"⏱️ Waiting {pause:.1f}s...")
+                        time.sleep(pause)
+                    in_flight.append((next_i, next_url, page, self._prefetch_post(page, next_url)))
+
+                i, url, page, prefetched = in_flight.popleft()
+                self.page = page
+
                 content_type = 'Reel' if self._is_reel(url) else 'Post'
-                self.logger.info(f"[{i}/{len(post_urls)}] Processing [{content_type}]: {url}")
+                self.logger.info(f"[{i}/{total}] Processing [{content_type}]: {url}")
 
                 try:
-                    data = self.scrape(
-                        url,
-                        get_tags=get_tags,
-                        get_likes=get_likes,
-                        get_timestamp=get_timestamp
-                    )
-                    results.append(data)
+                    if not prefetched:
+                        # Prefetch failed: regular navigation with retries and session recovery
+                        data = self.scrape(
+                            url,
+                            get_tags=get_tags,
+                            get_likes=get_likes,
+                            get_timestamp=get_timestamp
+                        )
+                    else:
+                        data = self._scrape_prefetched(
+                            url,
+                            get_tags=get_tags,
+                            get_likes=get_likes,
+                            get_timestamp=get_timestamp
+                        )
+                    consecutive_failures = 0
 
                 except Exception as e:
+                    consecutive_failures += 1
                     self.logger.error(f"Failed to scrape {url}: {e}")
                     # Add placeholder data
-                    results.append(PostData(
+                    data = PostData(
                         url=url,
                         tagged_accounts=[],
                         likes='ERROR',
                         timestamp='N/A',
                         content_type=content_type
-                    ))
+                    )
+
+                yield i, data
 
                 # Check memory usage and optimize if needed
                 if i % self.config.memory_check_interval == 0:
                     if not self.performance_monitor.check_memory_threshold(self.config.memory_threshold_mb):
                         self.performance_monitor.optimize_memory()
 
-                # Delay between posts (rate limiting)
-                if delay_between_posts and i < len(post_urls):
-                    delay = random.uniform(
-                        self.config.post_scrape_delay_min,
-                        self.config.post_scrape_delay_max
-                    )
-                    self.logger.debug(f"⏱️ Waiting {delay:.1f}s...")
-                    time.sleep(delay)
-
-            # Print final statistics
-            total_time = time.time() - start_time
-            success_count = sum(1 for r in results if r.likes != 'ERROR')
-            posts_count = sum(1 for r in results if r.content_type == 'Post' and r.likes != 'ERROR')
-            reels_count = sum(1 for r in results if r.content_type == 'Reel' and r.likes != 'ERROR')
-
-            self.logger.info(
-                f"\n{'='*70}\n"
-                f"📊 SCRAPING COMPLETE - STATISTICS\n"
-                f"{'='*70}\n"
-                f"Total URLs: {len(post_urls)}\n"
-                f"Successfully scraped: {success_count}/{len(post_urls)} "
-                f"({(success_count/len(post_urls)*100):.1f}%)\n"
-                f"  - Posts: {posts_count}\n"
-                f"  - Reels: {reels_count}\n"
-                f"Failed: {len(post_urls) - success_count}\n"
-                f"Total time: {total_time:.2f}s\n"
-                f"Average time per item: {total_time/len(post_urls):.2f}s\n"
-                f"{'='*70}"
-            )
-
-            # Print performance report
-            self.performance_monitor.print_report()
-
-            # Print error statistics
-            self.error_handler.print_stats()
-
-            return results
+                # Reuse this page for the next link; the delay paces new navigations
+                # (rate limiting): each starts at least `delay` after the previous one
+                next_link = next(links, None)
+                if next_link is not None:
+                    delay = self._next_post_delay(consecutive_failures) if delay_between_posts else 0.0
+                    last_due = max(time.monotonic(), last_due) + delay
+                    waiting.append((last_due, page, next_link))
 
         finally:
-            self.close()
+            self.page = main_page
+            for page in pages[1:]:
+                try:
+                    page.close()
+                except Exception:
+                    pass
+            # The main page outlives this batch (pooled / SharedBrowser): load media again
+            self._unblock_media(main_cdp)
 
     def get_tagged_accounts(self) -> List[str]:
         """
@@ -310,29 +1044,29 @@ class PostDataScraper(BaseScraper):
         Returns:
             List of usernames (without @)
         """
-        tagged = []
+        tagged: Dict[str, None] = {}  # Insertion-ordered set: O(1) dedup, stable order
 
-        # Check if this post has tags (look for Tags SVG)
+        # Tags SVG, <video> and already rendered tag containers in one round-trip
+        probe = None
         try:
-            has_tags = self.page.locator(self.config.selector_tag_button.replace('button:has(', '').replace(')', '')).count() > 0
-            if not has_tags:
-                self.logger.debug("No tag icon found - post has no tags")
-                return [self.config.default_no_tags_text]
+            probe = self.page.evaluate(_TAG_PROBE_JS, [
+                _tag_icon_selector(self.config),
+                self.config.selector_post_tag_container
+            ])
         except:
             pass
 
+        # Check if this post has tags (look for Tags SVG)
+        if probe is not None and not probe['icon']:
+            self.logger.debug("No tag icon found - post has no tags")
+            return [self.config.default_no_tags_text]
+
         # STEP 1: Detect if this is a VIDEO post or IMAGE post
-        is_video_post = False
-        try:
-            # Check for video element
-            video_count = self.page.locator('video').count()
-            if video_count > 0:
-                is_video_post = True
-                self.logger.debug("Detected VIDEO post")
-            else:
-                self.logger.debug("Detected IMAGE post")
-        except:
-            pass
+        is_video_post = probe is not None and probe['video']
+        if is_video_post:
+            self.logger.debug("Detected VIDEO post")
+        else:
+            self.logger.debug("Detected IMAGE post")
 
         # STEP 2: If VIDEO post, use POPUP extraction (like reels)
         if is_video_post:
@@ -348,8 +1082,7 @@ class PostDataScraper(BaseScraper):
                 # Click the tag button
                 self.logger.debug("Clicking tag button...")
                 tag_button.click(timeout=self.config.tag_button_click_timeout)
-                time.sleep(self.config.popup_animation_delay)
-                time.sleep(self.config.popup_content_load_delay)
+                _wait_for_tag_popup(self.page, self.config)
 
                 # CRITICAL: Extract from popup container ONLY
                 self.logger.debug("Extracting tags from popup...")
@@ -360,25 +1093,16 @@ class PostDataScraper(BaseScraper):
                     popup_container = self.page.locator(self.config.selector_popup_dialog).first
 
                 if popup_container.count() > 0:
-                    # Extract links ONLY from popup
-                    popup_links = popup_container.locator('a[href^="/"]').all()
-
-                    for link in popup_links:
-                        try:
-                            href = link.get_attribute('href', timeout=1000)
-                            if href and href.startswith('/') and href.endswith('/') and href.count('/') == 2:
-                                username = href.strip('/').split('/')[-1]
-
-                                # Filter out system paths
-                                if username in self.config.instagram_system_paths:
-                                    continue
-
-                                if username and username not in tagged:
-                                    tagged.append(username)
-                                    self.logger.debug(f"✓ Found tag: {username}")
-                        except:
+                    # Extract links ONLY from popup (filtered in the page, one round-trip)
+                    for username in popup_container.evaluate(_PROFILE_USERNAMES_JS):
+                        # Filter out system paths
+                        if username in self.config.instagram_system_paths:
                             continue
 
+                        if username and username not in tagged:
+                            tagged[username] = None
+                            self.logger.debug(f"✓ Found tag: {username}")
+
                     # Close popup
                     try:
                         close_button = self.page.locator(self.config.selector_close_button).first
@@ -387,8 +1111,8 @@ class PostDataScraper(BaseScraper):
                         self.page.keyboard.press('Escape')
 
                 if tagged:
-                    self.logger.info(f"✓ Found {len(tagged)} tags (VIDEO popup): {tagged}")
-                    return tagged
+                    self.logger.info(f"✓ Found {len(tagged)} tags (VIDEO popup): {list(tagged)}")
+                    return list(tagged)
 
             except Exception as e:
                 self.logger.warning(f"VIDEO post popup extraction failed: {e}")
@@ -401,70 +1125,76 @@ class PostDataScraper(BaseScraper):
         # STEP 3: If IMAGE post (or video extraction failed), use div._aa1y extraction
         self.logger.debug("Using IMAGE post tag extraction (div._aa1y method)...")
         try:
-            # Find all tag containers
-            tag_containers = self.page.locator(self.config.selector_post_tag_container).all()
-            self.logger.debug(f"Found {len(tag_containers)} {self.config.selector_post_tag_container} tag containers")
-
-            for container in tag_containers:
-                try:
-                    # Get the link inside this container
-                    link = container.locator('a[href]').first
-                    href = link.get_attribute('href', timeout=self.config.attribute_timeout)
-
-                    if href:
-                        # Extract username from href="/username/"
-                        username = href.strip('/').split('/')[-1]
+            if probe is not None and probe['tags']:
+                # Tag containers were already rendered when the probe ran
+                usernames = probe['tags']
+            else:
+                # The tag icon is there: no wait if the containers are already attached,
+                # otherwise a short one if the post has rendered (landmark present)
+                if self.page.locator(self.config.selector_post_tag_container).count() == 0:
+                    post_rendered = self.page.locator(self.config.selector_post_ready).count() > 0
+                    self._wait_attached(
+                        self.config.selector_post_tag_container,
+                        self.config.post_tag_settle_timeout if post_rendered else self.config.post_tag_wait_timeout
+                    )
 
-                        # Filter out system paths
-                        if username in self.config.instagram_system_paths:
-                            continue
+                # All tag containers' usernames in a single evaluate (href="/username/")
+                usernames = self.page.evaluate(_TAG_USERNAMES_JS, self.config.selector_post_tag_container)
+            self.logger.debug(f"Found {len(usernames)} {self.config.selector_post_tag_container} tag links")
 
-                        if username and username not in tagged:
-                            tagged.append(username)
-                            self.logger.debug(f"✓ Found tag: {username}")
-                except:
+            for username in usernames:
+                # Filter out system paths
+                if username in self.config.instagram_system_paths:
                     continue
 
+                if username and username not in tagged:
+                    tagged[username] = None
+                    self.logger.debug(f"✓ Found tag: {username}")
+
             if tagged:
-                self.logger.info(f"✓ Found {len(tagged)} tags (IMAGE): {tagged}")
-                return tagged
+                self.logger.info(f"✓ Found {len(tagged)} tags (IMAGE): {list(tagged)}")
+                return list(tagged)
 
         except Exception as e:
             self.logger.warning(f"Tag extraction from div._aa1y failed: {e}")
 
-        # FALLBACK: BeautifulSoup method
+        # FALLBACK: one HTML snapshot of the post container, parsed once (selectolax or lxml)
         try:
-            from bs4 import BeautifulSoup
-            html = self.page.content()
-            soup = BeautifulSoup(html, 'lxml')
+            html = self._post_html()
+            if html:
+                hrefs = _tag_hrefs_from_html(html, self.config.selector_post_tag_container)
+                self.logger.debug(f"HTML snapshot: Found {len(hrefs)} div._aa1y tag links")
 
-            tag_containers = soup.find_all('div', class_='_aa1y')
-            self.logger.debug(f"BS4: Found {len(tag_containers)} div._aa1y containers")
-
-            for container in tag_containers:
-                link = container.find('a', href=True)
-                if link and link.get('href'):
-                    href = link['href']
-                    username = href.strip('/').split('/')[-1]
+                for href in hrefs:
+                    username = href.rstrip('/').rpartition('/')[2]
 
                     # Filter out system paths
                     if username in self.config.instagram_system_paths:
                         continue
 
                     if username and username not in tagged:
-                        tagged.append(username)
+                        tagged[username] = None
 
             if tagged:
-                self.logger.info(f"✓ Found {len(tagged)} tags (BS4 method): {tagged}")
-                return tagged
+                self.logger.info(f"✓ Found {len(tagged)} tags (HTML snapshot): {list(tagged)}")
+                return list(tagged)
 
         except Exception as e:
-            self.logger.warning(f"BS4 tag extraction failed: {e}")
+            self.logger.warning(f"HTML snapshot tag extraction failed: {e}")
 
         # No tags found
         self.logger.warning("⚠️ No tags found in this post")
         return [self.config.default_no_tags_text]
 
+    def _post_html(self) -> str:
+        """HTML of the post container (a fraction of the full page), full page if it is missing"""
+        try:
+            return self.page.locator(self.config.selector_post_content).first.inner_html(
+                timeout=self.config.attribute_timeout
+            )
+        except Exception:
+            return self.page.content()
+
     def get_likes_count(self) -> str:
         """
         Extract likes count with multiple fallback methods
@@ -472,61 +1202,49 @@ class PostDataScraper(BaseScraper):
         Returns:
             Likes count as string
         """
-        # Method 1: span[role="button"] after Like SVG (new structure)
-        try:
-            section = self.page.locator('section').first
-            spans = section.locator('span[role="button"]').all()
-
-            for span in spans[:2]:  # First 2 spans (likes and comments)
-                try:
-                    text = span.inner_text(timeout=self.config.visibility_timeout).strip()
-                    # Check if it's a number
-                    if text and text.replace(',', '').replace('.', '').replace('K', '').replace('M', '').isdigit():
-                        self.logger.debug(f"✓ Found likes (method 1): {text}")
-                        return text.replace(',', '')
-                    # Handle K/M notation
-                    if text and ('K' in text or 'M' in text):
-                        self.logger.debug(f"✓ Found likes (method 1): {text}")
-                        return text
-                except Exception:
-                    continue
-        except Exception as e:
-            self.logger.debug(f"Method 1 failed: {e}")
-
-        # Method 2: Direct class selector
+        # Methods 1-3 read in one evaluate (the section is resolved once)
         try:
-            section = self.page.locator('section').first
-            likes_span = section.locator(self.config.selector_likes_options[0]).first
-            likes_text = likes_span.inner_text(timeout=self.config.visibility_timeout).strip()
-            if likes_text and likes_text.replace(',', '').isdigit():
-                self.logger.debug(f"✓ Found likes (method 2): {likes_text}")
-                return likes_text.replace(',', '')
+            self._wait_attached(self.config.selector_post_like_button, self.config.visibility_timeout)
+            texts = self.page.evaluate(
+                _LIKES_TEXTS_JS,
+                [
+                    self.config.selector_likes_options[0],
+                    self.config.selector_html_span,
+                    self.config.selector_post_like_button
+                ]
+            )
         except Exception as e:
-            self.logger.debug(f"Method 2 failed: {e}")
-
-        # Method 3: Link-based (old structure)
+            self.logger.debug(f"Methods 1-3 failed: {e}")
+            texts = None
+
+        if texts is not None:
+            # Method 1: span[role="button"] after Like SVG (new structure)
+            for text in texts['buttons']:
+                # Check if it's a number (K/M notation is kept as-is)
+                likes = _parse_likes_text(text)
+                if likes:
+                    self.logger.debug(f"✓ Found likes (method 1): {text}")
+                    return likes
+
+            # Method 2: Direct class selector
+            likes = _parse_likes_text(texts['classBased'])
+            if likes:
+                self.logger.debug(f"✓ Found likes (method 2): {texts['classBased']}")
+                return likes
+
+            # Method 3: Link-based (old structure)
+            likes = _parse_likes_text(texts['linkBased'])
+            if likes:
+                self.logger.debug(f"✓ Found likes (method 3): {texts['linkBased']}")
+                return likes
+
+        # Method 4: Text-based search (all candidates in one evaluate)
         try:
-            likes_link = self.page.locator('a[href*="/liked_by/"]').first
-            likes_text = likes_link.locator(self.config.selector_html_span).first.inner_text(timeout=self.config.visibility_timeout)
-            if likes_text.replace(',', '').isdigit():
-                self.logger.debug(f"✓ Found likes (method 3): {likes_text}")
-                return likes_text.strip().replace(',', '')
-        except Exception as e:
-            self.logger.debug(f"Method 3 failed: {e}")
-
-        # Method 4: Text-based search
-        try:
-            likes_count = self.page.locator('span:has-text("likes")').count()
-            for i in range(likes_count):
-                try:
-                    span = self.page.locator('span:has-text("likes")').nth(i)
-                    number = span.locator(self.config.selector_html_span).first
-                    text = number.inner_text(timeout=self.config.visibility_timeout)
-                    if text.replace(',', '').isdigit():
-                        self.logger.debug(f"✓ Found likes (method 4): {text}")
-                        return text.strip().replace(',', '')
-                except Exception:
-                    continue
+            for text in self.page.evaluate(_LIKES_MENTION_TEXTS_JS, self.config.selector_html_span):
+                likes = _parse_likes_text(text)
+                if likes:
+                    self.logger.debug(f"✓ Found likes (method 4): {text}")
+                    return likes
         except Exception as e:
             self.logger.debug(f"Method 4 failed: {e}")
 
@@ -583,24 +1301,22 @@ class PostDataScraper(BaseScraper):
         try:
             likes_span = self.page.locator(self.config.selector_reel_likes + '[role="button"]').first
             likes_text = likes_span.inner_text(timeout=self.config.reel_likes_timeout).strip()
-            if likes_text:
+            likes = _parse_likes_text(likes_text)
+            if likes:
                 self.logger.debug(f"✓ Found reel likes: {likes_text}")
-                return likes_text.replace(',', '')
+                return likes
         except Exception as e:
             self.logger.debug(f"Reel likes method 1 failed: {e}")
 
         # Method 2: General span with role=button (first one is usually likes)
         try:
-            spans = self.page.locator('span[role="button"]').all()
-            for span in spans[:3]:  # Check first 3
-                try:
-                    text = span.inner_text(timeout=self.config.visibility_timeout).strip()
-                    # Check if it looks like a number
-                    if text and (text.replace(',', '').replace('.', '').replace('K', '').replace('M', '').isdigit() or 'K' in text or 'M' in text):
-                        self.logger.debug(f"✓ Found reel likes (method 2): {text}")
-                        return text.replace(',', '')
-                except:
-                    continue
+            # First 3 texts in one evaluate
+            for text in self.page.evaluate(_ELEMENT_TEXTS_JS, ['span[role="button"]', 3, None]):
+                # Check if it looks like a number
+                likes = _parse_likes_text(text)
+                if likes:
+                    self.logger.debug(f"✓ Found reel likes (method 2): {text}")
+                    return likes
         except Exception as e:
             self.logger.debug(f"Reel likes method 2 failed: {e}")
 
@@ -666,7 +1382,7 @@ class PostDataScraper(BaseScraper):
         Returns:
             List of usernames (without @)
         """
-        tagged = []
+        tagged: Dict[str, None] = {}  # Ordered set (dict keys)
 
         try:
             # Step 1: Find and click tag button
@@ -685,28 +1401,22 @@ class PostDataScraper(BaseScraper):
             tag_button.click(timeout=self.config.tag_button_click_timeout)
 
             # Step 2: Wait for popup to appear
-            time.sleep(self.config.ui_animation_delay)
+            _wait_for_tag_popup(self.page, self.config)
 
             # Step 3: Extract tagged accounts from popup
             self.logger.debug("Extracting tagged accounts from popup...")
 
             # Method 1: All links in the popup
             try:
-                # Look for links with username pattern
-                links = self.page.locator('a[href^="/"]').all()
-                for link in links:
-                    try:
-                        href = link.get_attribute('href', timeout=1000)
-                        if href and href.startswith('/') and href.endswith('/') and href.count('/') == 2:
-                            username = href.strip('/').split('/')[-1]
-                            # Filter out Instagram system paths
-                            if username and username not in self.config.instagram_system_paths and username not in tagged:
-                                tagged.append(username)
-                    except:
-                        continue
+                # Links with username pattern inside the opened dialog (whole page if
+                # there is none), filtered in the page in one round-trip
+                for username in self.page.evaluate(_POPUP_USERNAMES_JS, self.config.selector_popup_dialog):
+                    # Filter out Instagram system paths
+                    if username and username not in self.config.instagram_system_paths and username not in tagged:
+                        tagged[username] = None
 
                 if tagged:
-                    self.logger.info(f"✓ Found {len(tagged)} tags in reel: {tagged}")
+                    self.logger.info(f"✓ Found {len(tagged)} tags in reel: {list(tagged)}")
 
                     # Close popup by clicking outside or close button
                     try:
@@ -716,7 +1426,7 @@ class PostDataScraper(BaseScraper):
                         # Try pressing Escape
                         self.page.keyboard.press('Escape')
 
-                    return tagged
+                    return list(tagged)
             except Exception as e:
                 self.logger.debug(f"Reel tag extraction from popup failed: {e}")
 
@@ -7,7 +7,7 @@ import json
 import os
 import time
 import random
-from typing import List, Set, Optional, Dict
+from typing import List, Optional, Dict, TextIO
 from pathlib import Path
 
 from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page
@@ -22,6 +22,67 @@ except ImportError:
     LIBRARY_AVAILABLE = False
 
 
+# Absolute URLs (a.href is resolved by the browser) of every link matching selector,
+# in page order and without duplicates
+_LINK_HREFS_JS = """(selector) => [...new Set(
+    [...document.querySelectorAll(selector)].map(a => a.href).filter(Boolean)
+)]"""
+
+# Same, but only links that were not returned before in this document, in page order and without duplicates.
+# The seen set lives on window, so it starts empty again after every navigation.
+_NEW_LINK_HREFS_JS = """(selector) => {
+    const seen = window.__igSeenLinks || (window.__igSeenLinks = new Set());
+    const fresh = [];
+    for (const a of document.querySelectorAll(selector)) {
+        if (!seen.has(a.href)) {
+            seen.add(a.href);
+            fresh.push(a.href);
+        }
+    }
+    return fresh;
+}"""
+
+# Scroll by a viewport fraction, wait until a link not returned before is added to
+# the DOM (at most timeout ms), then return the new hrefs as _NEW_LINK_HREFS_JS does:
+# one round-trip per scroll tick. Re-rendered or recycled grid rows only re-add
+# links already in the seen set, so they do not end the wait. The observer is
+# attached before scrolling so links rendered in between are not missed.
+_SCROLL_NEW_LINK_HREFS_JS = """async ([selector, percentage, timeout]) => {
+    const seen = window.__igSeenLinks || (window.__igSeenLinks = new Set());
+    const isNew = a => a.href && !seen.has(a.href);
+    await new Promise(resolve => {
+        const observer = new MutationObserver(mutations => {
+            for (const mutation of mutations) {
+                for (const node of mutation.addedNodes) {
+                    if (node.nodeType !== 1) {
+                        continue;
+                    }
+                    const links = node.matches(selector) ? [node] : node.querySelectorAll(selector);
+                    if (Array.prototype.some.call(links, isNew)) {
+                        observer.disconnect();
+                        resolve();
+                        return;
+                    }
+                }
+            }
+        });
+        observer.observe(document.body, {childList: true, subtree: true});
+        window.scrollBy(0, window.innerHeight * percentage);
+        setTimeout(() => { observer.disconnect(); resolve(); }, timeout);
+    });
+    return (%s)(selector);
+}""" % _NEW_LINK_HREFS_JS
+
+
+def _link_type(url: str) -> str:
+    """Content type of a post/reel link ('Post', 'Reel' or 'Unknown')"""
+    if '/p/' in url:
+        return 'Post'
+    if '/reel/' in url:
+        return 'Reel'
+    return 'Unknown'
+
+
 class InstagramPostLinksScraper:
     """Instagram postlar linklarini scraping qilish - 100% ACCURATE"""
 
@@ -108,39 +169,38 @@ class InstagramPostLinksScraper:
     def extract_post_links(self):
         """Barcha post va reel linklarini topish (scroll qilmasdan)"""
         try:
-            # Post va reel linklarini topish
-            # /p/ yoki /reel/ pattern
-            links = self.page.locator(self.config.selector_post_reel_links).all()
-
-            # Href larni olish
-            hrefs = set()
-            for link in links:
-                href = link.get_attribute('href')
-                if href:
-                    # To'liq URL yaratish
-                    if href.startswith('/'):
-                        href = self.config.instagram_base_url.rstrip('/') + href
-                    hrefs.add(href)
-
-            return hrefs
+            # Post va reel linklarini topish (/p/ yoki /reel/ pattern)
+            # To'liq URL lar bitta evaluate bilan olinadi
+            return set(self.page.evaluate(_LINK_HREFS_JS, self.config.selector_post_reel_links))
         except Exception as e:
             print(f'⚠️  Linklar olishda xatolik: {e}')
             return set()
 
+    def _extract_new_post_links(self):
+        """Oldin olinmagan yangi post va reel linklarini topish (scroll qilmasdan)"""
+        try:
+            # Faqat yangi to'liq URL lar bitta evaluate bilan olinadi (tartibli, takrorlarsiz)
+            return self.page.evaluate(_NEW_LINK_HREFS_JS, self.config.selector_post_reel_links)
+        except Exception as e:
+            print(f'⚠️  Linklar olishda xatolik: {e}')
+            return []
+
     def scroll_and_collect_links(self, target_posts_count):
         """Scroll qilib barcha post linklarini yig'ish - USER'S PROVEN METHOD"""
         print(f'\n📜 Scroll qilib {target_posts_count} ta post linkini yig\'ish boshlandi...\n')
 
-        all_links = set()
+        all_links = {}  # dict: tartibli va takrorlarsiz
+        new_count = 0
         scroll_attempts = 0
         no_new_links_count = 0
         max_no_new_attempts = self.config.scroll_max_no_new_attempts
 
+        # Hozirgi linklarni olish (keyingilari scroll bilan birga olinadi)
+        current_links = self._extract_new_post_links()
+
         while True:
-            # Hozirgi linklarni olish
-            current_links = self.extract_post_links()
-            previous_count = len(all_links)
-            all_links.update(current_links)
+            previous_count = new_count
+            all_links.update(dict.fromkeys(current_links))
             new_count = len(all_links)
 
             # Progress ko'rsatish
@@ -162,11 +222,14 @@ class InstagramPostLinksScraper:
                 break
 
             # Scroll qilish (odamga o'xshab) - USER'S PROVEN METHOD
-            self.page.evaluate(f'window.scrollBy(0, window.innerHeight * {self.config.scroll_viewport_percentage})')
-
-            # 1.5-2.5 sekund kutish (random) - ANTI-DETECTION
+            # Yangi linklar paydo bo'lishi bilan davom etiladi va ular shu evaluate da qaytadi,
+            # 1.5-2.5 sekund (random) faqat maksimal kutish - ANTI-DETECTION
             wait_time = random.uniform(self.config.scroll_wait_range[0], self.config.scroll_wait_range[1])
-            time.sleep(wait_time)
+            current_links = self.page.evaluate(_SCROLL_NEW_LINK_HREFS_JS, [
+                self.config.selector_post_reel_links,
+                self.config.scroll_viewport_percentage,
+                wait_time * 1000
+            ])
 
             scroll_attempts += 1
 
@@ -180,8 +243,7 @@ class InstagramPostLinksScraper:
     def save_links_to_file(self, links, filename='post_links.txt'):
         """Linklarni faylga saqlash"""
         with open(filename, 'w', encoding='utf-8') as f:
-            for link in sorted(links):
-                f.write(link + '\n')
+            f.write(''.join(link + '\n' for link in links))
         print(f'\n💾 Linklar saqlandi: {filename}')
 
     def close(self):
@@ -229,6 +291,7 @@ if LIBRARY_AVAILABLE:
         This wrapper integrates the proven standalone method into the library.
         Features:
         - Collects ONLY posts (a[href*="/p/"]) and reels (a[href*="/reel/"])
+        - Reads the profile's JSON feed when possible, scrolls the grid otherwise
         - Uses user's proven human-like scrolling method
         - Real-time progress tracking
         - Smart stopping (3 attempts with no new links)
@@ -260,6 +323,15 @@ if LIBRARY_AVAILABLE:
             username = username.strip().lstrip('@')
             self.logger.info(f"Starting post links scrape for: @{username}")
 
+            # Fast path: the JSON feed lists the links without opening the profile
+            if self.config.post_links_api_fast_path:
+                links = self._fetch_links_via_api(username, target_count)
+                if links is not None:
+                    if save_to_file:
+                        self._save_links(links)
+                    self.logger.info(f"⚡ Collected {len(links)} post links via feed API")
+                    return links
+
             # Check if browser is already setup (SharedBrowser mode)
             is_shared_browser = self.page is not None and self.browser is not None
 
@@ -271,6 +343,9 @@ if LIBRARY_AVAILABLE:
                 session_data = self.load_session()
                 self.setup_browser(session_data)
 
+            # Only anchors are read: skip thumbnails/video/fonts while scrolling the grid
+            media_cdp = self._block_media(self.page)
+
             try:
                 # Navigate to profile
                 profile_url = f'https://www.instagram.com/{username}/'
@@ -286,11 +361,17 @@ if LIBRARY_AVAILABLE:
                     self.logger.info(f"Target: {target_count} posts")
 
                 # Scroll and collect links using USER'S PROVEN METHOD
-                links = self._scroll_and_collect_proven(target_count)
-
-                # Save to file
-                if save_to_file:
-                    self._save_links(links)
+                # (new links are streamed to a temporary file that replaces
+                # links_file only once collection finished)
+                output = self._open_links_output() if save_to_file else None
+                try:
+                    links = self._scroll_and_collect_proven(target_count, output)
+                except BaseException:
+                    if output is not None:
+                        self._close_links_output(output, keep=False)
+                    raise
+                if output is not None:
+                    self._close_links_output(output, keep=True)
 
                 self.logger.info(f"Collected {len(links)} post links")
                 return links
@@ -300,13 +381,34 @@ if LIBRARY_AVAILABLE:
                 if not is_shared_browser:
                     self.close()
                 else:
+                    # The shared page is reused by other scrapers: load media again
+                    self._unblock_media(media_cdp)
                     self.logger.debug("Keeping browser open (SharedBrowser mode)")
 
+        def _fetch_links_via_api(self, username: str, target_count: Optional[int]) -> Optional[List[Dict[str, str]]]:
+            """
+            Collect links from the profile's JSON feed (no browser)
+
+            Returns:
+                List of dictionaries with 'url' and 'type' keys, or None to scroll the grid instead
+            """
+            from .fast_post import FastPostScraper
+            try:
+                fast = FastPostScraper(self.config, self.load_session(), self.logger)
+            except Exception as e:
+                self.logger.debug(f"Feed API unavailable: {e}")
+                return None
+
+            urls = fast.fetch_post_links(username, limit=target_count)
+            if urls is None:
+                self.logger.info("Feed API unavailable, scrolling the profile grid")
+                return None
+            return [{'url': url, 'type': _link_type(url)} for url in urls]
+
         def _profile_exists(self) -> bool:
             """Check if profile exists"""
             try:
-                content = self.page.content()
-                return not any(text in content for text in self.config.profile_not_found_strings)
+                return not self._page_contains_any(self.config.profile_not_found_strings)
             except Exception:
                 return False
 
@@ -322,55 +424,57 @@ if LIBRARY_AVAILABLE:
                 self.logger.warning(f"Could not get posts count: {e}")
                 return 9999  # Large number as fallback
 
-        def _extract_current_links_proven(self) -> Set[str]:
+        def _extract_current_links_proven(self) -> List[str]:
             """
             Extract links using USER'S PROVEN DIRECT SELECTOR METHOD
 
             Returns:
-                Set of URLs
+                URLs not returned before on this page, in page order
             """
             try:
                 # USER'S PROVEN METHOD: Direct selector for posts and reels
-                links = self.page.locator(self.config.selector_post_reel_links).all()
-
-                hrefs = set()
-                for link in links:
-                    href = link.get_attribute('href')
-                    if href:
-                        # Make full URL
-                        if href.startswith('/'):
-                            href = self.config.instagram_base_url.rstrip('/') + href
-                        hrefs.add(href)
-
-                return hrefs
+                # (only the new full URLs cross over, in a single evaluate)
+                return self.page.evaluate(_NEW_LINK_HREFS_JS, self.config.selector_post_reel_links)
 
             except Exception as e:
                 self.logger.error(f"Error extracting links: {e}")
-                return set()
+                return []
 
-        def _scroll_and_collect_proven(self, target_count: int) -> List[Dict[str, str]]:
+        def _scroll_and_collect_proven(self, target_count: int, output: Optional[TextIO] = None) -> List[Dict[str, str]]:
             """
             Scroll and collect links using USER'S PROVEN 100% ACCURATE METHOD
 
             Args:
                 target_count: Target number of links
+                output: Open text file that receives each new link as a 'url<TAB>type' line
 
             Returns:
                 List of dictionaries with 'url' and 'type' keys
             """
             self.logger.info(f"Starting scroll collection (target: {target_count})...")
 
-            all_links = set()
+            all_links: Dict[str, None] = {}  # Ordered, de-duplicated URLs
+            new_count = 0
             scroll_attempts = 0
             no_new_links_count = 0
             MAX_NO_NEW = self.config.scroll_max_no_new_attempts
 
+            # Extract current links using proven method (later ones come with each scroll)
+            current_links = self._extract_current_links_proven()
+
             while True:
-                # Extract current links using proven method
-                current_links = self._extract_current_links_proven()
-                previous_count = len(all_links)
-                all_links.update(current_links)
-                new_count = len(all_links)
+                previous_count = new_count
+                fresh = [url for url in dict.fromkeys(current_links) if url not in all_links]
+                all_links.update(dict.fromkeys(fresh))
+                new_count += len(fresh)
+                if output is not None and fresh:
+                    try:
+                        output.write(''.join(f"{url}\t{_link_type(url)}\n" for url in fresh))
+                    except OSError as e:
+                        # Not fatal: collection goes on, the closed file is discarded afterwards
+                        self.logger.error(f"Failed to save links: {e}")
+                        output.close()
+                        output = None
 
                 # Log progress
                 self.logger.info(
@@ -403,43 +507,71 @@ if LIBRARY_AVAILABLE:
                     break
 
                 # USER'S PROVEN METHOD: Human-like scroll
-                self._human_like_scroll_proven()
+                current_links = self._human_like_scroll_proven()
                 scroll_attempts += 1
 
-            # Convert to list of dicts with type detection
-            result = []
-            for url in sorted(all_links):
-                if '/p/' in url:
-                    content_type = 'Post'
-                elif '/reel/' in url:
-                    content_type = 'Reel'
-                else:
-                    content_type = 'Unknown'
-                result.append({'url': url, 'type': content_type})
+            # Convert to list of dicts with type detection (profile grid order, newest first)
+            return [{'url': url, 'type': _link_type(url)} for url in all_links]
 
-            return result
-
-        def _human_like_scroll_proven(self) -> None:
+        def _human_like_scroll_proven(self) -> List[str]:
             """
             USER'S PROVEN 100% ACCURATE SCROLLING METHOD
 
-            Scrolls 80% of viewport height and waits random 1.5-2.5 seconds
+            Scrolls 80% of viewport height and waits until new links are rendered,
+            at most a random 1.5-2.5 seconds
+
+            Returns:
+                URLs not returned before on this page, in page order
             """
             try:
                 # USER'S PROVEN: Scroll 80% of viewport (human-like)
-                self.page.evaluate(f'window.scrollBy(0, window.innerHeight * {self.config.scroll_viewport_percentage})')
-
-                # USER'S PROVEN: Random wait 1.5-2.5 seconds (anti-detection)
+                # Random wait 1.5-2.5 seconds (anti-detection) is only the upper bound
+                started = time.time()
                 wait_time = random.uniform(self.config.scroll_wait_range[0], self.config.scroll_wait_range[1])
-                time.sleep(wait_time)
+                new_links = self.page.evaluate(_SCROLL_NEW_LINK_HREFS_JS, [
+                    self.config.selector_post_reel_links,
+                    self.config.scroll_viewport_percentage,
+                    wait_time * 1000
+                ])
 
-                self.logger.debug(f"Scrolled (waited {wait_time:.2f}s)")
+                self.logger.debug(f"Scrolled (waited {time.time() - started:.2f}s, {len(new_links)} new links)")
+                return new_links
 
             except Exception as e:
                 self.logger.debug(f"Scroll error: {e}")
                 # Fallback: scroll to bottom
                 self.page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
                 time.sleep(self.config.scroll_post_delay)
+                return self._extract_current_links_proven()
+
+        def _open_links_output(self) -> Optional[TextIO]:
+            """
+            Open the temporary file (links_file + '.tmp') that new links are streamed to
+
+            Returns:
+                The open file, or None if it cannot be created (links are then only returned)
+            """
+            try:
+                return open(f"{self.config.links_file}.tmp", 'w', encoding='utf-8')
+            except OSError as e:
+                self.logger.error(f"Failed to save links: {e}")
+                return None
+
+        def _close_links_output(self, output: TextIO, keep: bool) -> None:
+            """
+            Close the streamed links file: move it over links_file if keep and every
+            write succeeded, otherwise delete it (the previous links_file stays untouched)
+            """
+            keep = keep and not output.closed  # Closed early by a failed write
+            try:
+                output.close()
+                if keep:
+                    os.replace(output.name, self.config.links_file)
+                    self.logger.info(f"Links saved to: {Path(self.config.links_file)}")
+                else:
+                    os.remove(output.name)
+            except OSError as e:
+                self.logger.error(f"Failed to save links: {e}")
 
         def _save_links(self, links: List[Dict[str, str]]) -> None:
             """
@@ -452,10 +584,7 @@ if LIBRARY_AVAILABLE:
 
             try:
                 with open(output_file, 'w', encoding='utf-8') as f:
-                    for link_data in links:
-                        url = link_data['url']
-                        content_type = link_data['type']
-                        f.write(f"{url}\t{content_type}\n")
+                    f.write(''.join(f"{link_data['url']}\t{link_data['type']}\n" for link_data in links))
 
                 self.logger.info(f"Links saved to: {output_file}")
 
@@ -489,7 +618,7 @@ def main():
         # Birinchi 5 ta linkni ko'rsatish
         if links:
             print('\n🔗 Misol linklar (birinchi 5 ta):')
-            for i, link in enumerate(sorted(links)[:5], 1):
+            for i, link in enumerate(links[:5], 1):
                 print(f'  {i}. {link}')
 
     except Exception as e:
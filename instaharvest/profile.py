@@ -128,11 +128,7 @@ class ProfileScraper(BaseScraper):
     def _profile_exists(self) -> bool:
         """Check if profile exists"""
         try:
-            content = self.page.content()
-            for not_found_string in self.config.profile_not_found_strings:
-                if not_found_string in content:
-                    return False
-            return True
+            return not self._page_contains_any(self.config.profile_not_found_strings)
         except Exception as e:
             self.logger.error(f"Error checking profile existence: {e}")
             return False
@@ -8,11 +8,12 @@ ALOHIDA FAYL - FAQAT REELS UCHUN!
 import time
 import random
 from typing import List, Optional, Dict, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 
 from .base import BaseScraper
 from .config import ScraperConfig
 from .exceptions import HTMLStructureChangedError
+from .post_data import _parse_likes_text, _TAG_USERNAMES_JS, _PROFILE_USERNAMES_JS, _ELEMENT_TEXTS_JS, _wait_for_tag_popup
 
 
 @dataclass
@@ -25,8 +26,14 @@ class ReelData:
     content_type: str = 'Reel'  # Always 'Reel'
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        return asdict(self)
+        """Convert to dictionary (flat fields, so no recursive asdict() walk)"""
+        return {
+            'url': self.url,
+            'tagged_accounts': list(self.tagged_accounts),
+            'likes': self.likes,
+            'timestamp': self.timestamp,
+            'content_type': self.content_type
+        }
 
 
 class ReelDataScraper(BaseScraper):
@@ -72,11 +79,11 @@ class ReelDataScraper(BaseScraper):
 
         self.logger.info(f"🎬 Scraping REEL: {reel_url}")
 
-        # Navigate to reel
-        self.goto_url(reel_url)
+        # Navigate to reel (no fixed delay: we wait for the reel itself below)
+        self.goto_url(reel_url, delay=0)
 
         # CRITICAL: Wait for content to load
-        time.sleep(self.config.reel_open_delay)
+        self._wait_for_reel_ready()
 
         # Extract data
         tagged_accounts = self.get_tagged_accounts() if get_tags else []
@@ -98,6 +105,17 @@ class ReelDataScraper(BaseScraper):
 
         return data
 
+    def _wait_for_reel_ready(self) -> None:
+        """Wait until the reel landmark (timestamp or like button) is in the DOM"""
+        try:
+            self.page.wait_for_selector(
+                self.config.selector_post_ready,
+                state='attached',
+                timeout=self.config.post_ready_timeout
+            )
+        except Exception:
+            self.logger.debug("Reel landmark not found, extracting anyway")
+
     def scrape_multiple(
         self,
         reel_urls: List[str],
@@ -200,42 +218,36 @@ class ReelDataScraper(BaseScraper):
         try:
             likes_span = self.page.locator(self.config.selector_reel_likes + '[role="button"]').first
             likes_text = likes_span.inner_text(timeout=self.config.reel_likes_timeout).strip()
-            if likes_text:
+            likes = _parse_likes_text(likes_text)
+            if likes:
                 self.logger.debug(f"✓ Found reel likes: {likes_text}")
-                return likes_text.replace(',', '')
+                return likes
         except Exception as e:
             self.logger.debug(f"Reel likes method 1 failed: {e}")
 
         # Method 2: General span with role=button (first one is usually likes)
         try:
-            spans = self.page.locator('span[role="button"]').all()
-            for span in spans[:3]:  # Check first 3
-                try:
-                    text = span.inner_text(timeout=self.config.visibility_timeout).strip()
-                    # Check if it looks like a number
-                    if text and (text.replace(',', '').replace('.', '').replace('K', '').replace('M', '').isdigit() or 'K' in text or 'M' in text):
-                        self.logger.debug(f"✓ Found reel likes (method 2): {text}")
-                        return text.replace(',', '')
-                except:
-                    continue
+            # First 3 texts in one evaluate
+            for text in self.page.evaluate(_ELEMENT_TEXTS_JS, ['span[role="button"]', 3, None]):
+                # Check if it looks like a number
+                likes = _parse_likes_text(text)
+                if likes:
+                    self.logger.debug(f"✓ Found reel likes (method 2): {text}")
+                    return likes
         except Exception as e:
             self.logger.debug(f"Reel likes method 2 failed: {e}")
 
         # Method 3: Try any span with number-like content
         try:
-            section = self.page.locator('section').first
-            spans = section.locator('span').all()
-            for span in spans[:self.config.reel_max_span_check]:
-                try:
-                    text = span.inner_text(timeout=self.config.attribute_timeout).strip()
-                    # Check if it's purely numeric or has K/M notation
-                    if text and len(text) < 20:  # Reasonable length for likes
-                        clean_text = text.replace(',', '').replace('.', '')
-                        if clean_text.replace('K', '').replace('M', '').isdigit():
-                            self.logger.debug(f"✓ Found reel likes (method 3): {text}")
-                            return text.replace(',', '')
-                except:
-                    continue
+            # Span texts of the first <section> in one evaluate
+            texts = self.page.evaluate(_ELEMENT_TEXTS_JS, ['span', self.config.reel_max_span_check, 'section'])
+            for text in texts:
+                # Check if it's purely numeric or has K/M notation
+                if text and len(text) < 20:  # Reasonable length for likes
+                    likes = _parse_likes_text(text)
+                    if likes:
+                        self.logger.debug(f"✓ Found reel likes (method 3): {text}")
+                        return likes
         except Exception as e:
             self.logger.debug(f"Reel likes method 3 failed: {e}")
 
@@ -316,7 +328,7 @@ class ReelDataScraper(BaseScraper):
         Returns:
             List of usernames (without @)
         """
-        tagged = []
+        tagged: Dict[str, None] = {}  # Ordered set (dict keys)
 
         try:
             # Step 1: Find and click tag button
@@ -335,16 +347,13 @@ class ReelDataScraper(BaseScraper):
             tag_button.click(timeout=self.config.tag_button_click_timeout)
 
             # Step 2: Wait for popup to appear
-            time.sleep(self.config.ui_animation_delay)
+            _wait_for_tag_popup(self.page, self.config)
 
             # Step 3: Extract tagged accounts from popup (EXCLUDE comment section!)
             self.logger.debug("Extracting tagged accounts from popup...")
 
             # Method 1: Links ONLY from popup container (NOT from comment section!)
             try:
-                # Wait for popup content to load
-                time.sleep(self.config.popup_content_load_delay)
-
                 # CRITICAL FIX: Extract links ONLY from within popup container
                 # Popup class: x1cy8zhl x9f619 x78zum5 xl56j7k x2lwn1j xeuugli x47corl
                 self.logger.debug("Looking for popup container...")
@@ -357,28 +366,21 @@ class ReelDataScraper(BaseScraper):
                     # Alternative: any div with role="dialog" or similar popup indicators
                     popup_container = self.page.locator(self.config.selector_popup_dialog).first
 
-                # Extract links ONLY from within the popup container
-                links = popup_container.locator('a[href^="/"]').all()
-                self.logger.debug(f"Found {len(links)} links in popup")
+                # Extract profile links ONLY from within the popup container (one evaluate)
+                usernames = popup_container.evaluate(_PROFILE_USERNAMES_JS) if popup_container.count() > 0 else []
+                self.logger.debug(f"Found {len(usernames)} profile links in popup")
 
-                for link in links:
-                    try:
-                        href = link.get_attribute('href', timeout=self.config.attribute_timeout)
-                        if href and href.startswith('/') and href.endswith('/') and href.count('/') == 2:
-                            username = href.strip('/').split('/')[-1]
-
-                            # Filter out Instagram system paths
-                            if username in self.config.instagram_system_paths:
-                                continue
-
-                            if username not in tagged:
-                                tagged.append(username)
-                                self.logger.debug(f"✓ Added tag: {username}")
-                    except:
+                for username in usernames:
+                    # Filter out Instagram system paths
+                    if username in self.config.instagram_system_paths:
                         continue
 
+                    if username not in tagged:
+                        tagged[username] = None
+                        self.logger.debug(f"✓ Added tag: {username}")
+
                 if tagged:
-                    self.logger.info(f"✓ Found {len(tagged)} tags in reel: {tagged}")
+                    self.logger.info(f"✓ Found {len(tagged)} tags in reel: {list(tagged)}")
 
                     # Close popup by clicking close button
                     try:
@@ -393,7 +395,7 @@ class ReelDataScraper(BaseScraper):
                         except:
                             pass
 
-                    return tagged
+                    return list(tagged)
             except Exception as e:
                 self.logger.debug(f"Reel tag extraction from popup failed: {e}")
 
@@ -409,21 +411,14 @@ class ReelDataScraper(BaseScraper):
         # Fallback: Try looking for div._aa1y (post-style tags)
         try:
             self.logger.debug("Fallback: Looking for post-style tags in reel...")
-            tag_containers = self.page.locator(self.config.selector_post_tag_container).all()
-            for container in tag_containers:
-                try:
-                    link = container.locator('a[href]').first
-                    href = link.get_attribute('href', timeout=self.config.visibility_timeout)
-                    if href:
-                        username = href.strip('/').split('/')[-1]
-                        if username and username not in tagged:
-                            tagged.append(username)
-                except:
-                    continue
+            # All containers' usernames in a single evaluate (one CDP round-trip)
+            for username in self.page.evaluate(_TAG_USERNAMES_JS, self.config.selector_post_tag_container):
+                if username and username not in tagged:
+                    tagged[username] = None
 
             if tagged:
-                self.logger.info(f"✓ Found {len(tagged)} tags (fallback method): {tagged}")
-                return tagged
+                self.logger.info(f"✓ Found {len(tagged)} tags (fallback method): {list(tagged)}")
+                return list(tagged)
         except Exception as e:
             self.logger.debug(f"Fallback tag extraction failed: {e}")
 
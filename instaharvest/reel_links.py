@@ -15,6 +15,10 @@ from .config import ScraperConfig
 from .exceptions import ProfileNotFoundError
 
 
+# Absolute URLs (a.href is resolved by the browser) of every link matching selector, in one round-trip
+_LINK_HREFS_JS = "(selector) => Array.from(document.querySelectorAll(selector), a => a.href)"
+
+
 class ReelLinksScraper(BaseScraper):
     """
     Instagram REEL links scraper - FAQAT REELS!
@@ -95,8 +99,7 @@ class ReelLinksScraper(BaseScraper):
     def _profile_exists(self) -> bool:
         """Check if profile/reels page exists"""
         try:
-            content = self.page.content()
-            return 'Page Not Found' not in content and 'Sorry, this page' not in content
+            return not self._page_contains_any(self.config.profile_not_found_strings)
         except Exception:
             return False
 
@@ -112,44 +115,14 @@ class ReelLinksScraper(BaseScraper):
             List of reel URLs
         """
         try:
-            results = []
-            seen_urls = set()
-
-            # Find all post/reel grid containers
-            containers = self.page.locator(self.config.selector_reel_container).all()
+            # ONLY /reel/ links inside the grid containers, as full URLs (a.href), in one evaluate
+            hrefs = self.page.evaluate(
+                _LINK_HREFS_JS,
+                f"{self.config.selector_reel_container} {self.config.selector_reel_links}"
+            )
 
-            for container in containers:
-                try:
-                    # Get all links within this container
-                    links = container.locator('a[href]').all()
-
-                    for link in links:
-                        try:
-                            href = link.get_attribute('href')
-                            if not href:
-                                continue
-
-                            # ONLY collect /reel/ links
-                            if '/reel/' not in href:
-                                continue
-
-                            # Make full URL
-                            if href.startswith('/'):
-                                href = f'https://www.instagram.com{href}'
-
-                            # Skip duplicates
-                            if href in seen_urls:
-                                continue
-                            seen_urls.add(href)
-
-                            # Add reel
-                            results.append(href)
-                        except:
-                            continue
-                except:
-                    continue
-
-            return results
+            # Skip duplicates
+            return list(dict.fromkeys(hrefs))
 
         except Exception as e:
             self.logger.error(f"Error extracting reel links: {e}")
@@ -11,6 +11,61 @@ from pathlib import Path
 from playwright.sync_api import sync_playwright
 from .config import ScraperConfig
 
+# Optional: orjson parses session files several times faster than stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def read_json_file(path):
+    """
+    Read and parse a JSON file, using orjson when installed.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+            (orjson.JSONDecodeError is a subclass)
+    """
+    with open(path, 'rb') as f:
+        return parse_json_bytes(f.read())
+
+
+def parse_json_bytes(data):
+    """
+    Parse raw JSON bytes (e.g. a session file read once and shipped to workers).
+
+    Args:
+        data: UTF-8 encoded JSON
+
+    Returns:
+        Parsed JSON data
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_json_bytes(data):
+    """
+    Serialize data to compact UTF-8 JSON bytes, using orjson when installed.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        Encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
 
 def get_default_session_path():
     """
@@ -169,5 +224,4 @@ def load_session_data(session_file=None):
             f"Please create a session first using: save_session()"
         )
 
-    with open(session_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return read_json_file(session_file)
@@ -9,11 +9,13 @@ from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page,
 
 from .config import ScraperConfig
 from .logger import setup_logger
+from .session_utils import read_json_file
 from .follow import FollowManager
 from .message import MessageManager
 from .followers import FollowersCollector
 from .profile import ProfileScraper
 from .post_links import PostLinksScraper
+from .post_data import PostDataScraper
 from .reel_links import ReelLinksScraper
 
 
@@ -27,6 +29,7 @@ class SharedBrowser:
     - Collect followers/following
     - Scrape profiles
     - Collect links
+    - Scrape post data (tags, likes, timestamp)
     - etc.
 
     Example:
@@ -74,6 +77,7 @@ class SharedBrowser:
         self._followers_collector: Optional[FollowersCollector] = None
         self._profile_scraper: Optional[ProfileScraper] = None
         self._post_links_scraper: Optional[PostLinksScraper] = None
+        self._post_data_scraper: Optional[PostDataScraper] = None
         self._reel_links_scraper: Optional[ReelLinksScraper] = None
 
         self.logger.info("✨ SharedBrowser initialized")
@@ -94,7 +98,6 @@ class SharedBrowser:
         self.logger.info("🚀 Starting shared browser session...")
 
         # Load session
-        import json
         from pathlib import Path
 
         session_path = Path(self.session_file)
@@ -104,8 +107,7 @@ class SharedBrowser:
                 f"Run save_session.py first."
             )
 
-        with open(self.session_file, 'r', encoding='utf-8') as f:
-            session_data = json.load(f)
+        session_data = read_json_file(self.session_file)
 
         self.logger.info(f"📂 Session loaded: {len(session_data.get('cookies', []))} cookies")
 
@@ -115,7 +117,8 @@ class SharedBrowser:
         # Launch browser
         self.browser = self.playwright.chromium.launch(
             channel=self.config.browser_channel,
-            headless=headless
+            headless=headless,
+            args=self.config.browser_args
         )
         self.logger.info(f"🌐 Browser launched (headless={headless})")
 
@@ -187,6 +190,13 @@ class SharedBrowser:
             self._post_links_scraper.page = None
             self._post_links_scraper = None
 
+        if self._post_data_scraper:
+            self._post_data_scraper.playwright = None
+            self._post_data_scraper.browser = None
+            self._post_data_scraper.context = None
+            self._post_data_scraper.page = None
+            self._post_data_scraper = None
+
         if self._reel_links_scraper:
             self._reel_links_scraper.playwright = None
             self._reel_links_scraper.browser = None
@@ -286,6 +296,19 @@ class SharedBrowser:
             self._post_links_scraper = scraper
         return self._post_links_scraper
 
+    @property
+    def post_data_scraper(self) -> PostDataScraper:
+        """Get PostDataScraper instance (lazy loading)"""
+        if self._post_data_scraper is None:
+            scraper = PostDataScraper(self.config)
+            # Inject existing browser components
+            scraper.playwright = self.playwright
+            scraper.browser = self.browser
+            scraper.context = self.context
+            scraper.page = self.page
+            self._post_data_scraper = scraper
+        return self._post_data_scraper
+
     @property
     def reel_links_scraper(self) -> ReelLinksScraper:
         """Get ReelLinksScraper instance (lazy loading)"""
@@ -450,6 +473,27 @@ class SharedBrowser:
         """
         return self.reel_links_scraper.scrape(username, save_to_file=save_to_file)
 
+    def scrape_post_data(self, post_urls: list, get_tags: bool = True, get_likes: bool = True, get_timestamp: bool = True) -> list:
+        """
+        Scrape tags, likes and timestamp of posts/reels
+
+        Args:
+            post_urls: List of post/reel URLs
+            get_tags: Extract tagged accounts
+            get_likes: Extract likes count
+            get_timestamp: Extract post timestamp
+
+        Returns:
+            List of post data dicts
+        """
+        results = self.post_data_scraper.scrape_multiple(
+            post_urls,
+            get_tags=get_tags,
+            get_likes=get_likes,
+            get_timestamp=get_timestamp
+        )
+        return [data.to_dict() for data in results]
+
     # ==================== CONTEXT MANAGER ====================
 
     def __enter__(self):
@@ -36,10 +36,13 @@ setup(
         "playwright>=1.40.0",
         "pandas>=2.0.0",
         "openpyxl>=3.1.0",
-        "beautifulsoup4>=4.12.0",
         "lxml>=4.9.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.9.0",
+            "selectolax>=0.3.21",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -0,0 +1,45 @@
+"""Tests for the browserless media API path"""
+
+from instaharvest.config import ScraperConfig
+from instaharvest.fast_post import FastPostScraper
+
+
+POST_URL = 'https://www.instagram.com/p/DAbCdEfGhIj/'
+
+
+def _scraper(payload):
+    scraper = FastPostScraper(ScraperConfig(), session_data={'cookies': []})
+    scraper._get_json = lambda url, referer: payload
+    return scraper
+
+
+def test_fetch_handles_null_carousel_usertags_and_user():
+    payload = {'items': [{
+        'carousel_media': None,
+        'usertags': {'in': [{'user': None}, {'user': {'username': 'alice'}}]},
+        'like_count': 12,
+        'taken_at': None,
+    }]}
+
+    data = _scraper(payload).fetch(POST_URL)
+
+    assert data is not None
+    assert data.tagged_accounts == ['alice']
+    assert data.likes == '12'
+    assert data.timestamp == 'N/A'
+
+
+def test_fetch_handles_null_usertags():
+    payload = {'items': [{'carousel_media': [{'usertags': None}], 'usertags': {'in': None}}]}
+
+    data = _scraper(payload).fetch(POST_URL)
+
+    assert data is not None
+    assert data.tagged_accounts == [ScraperConfig().default_no_tags_text]
+
+
+def test_fetch_returns_none_for_malformed_item():
+    # Falls back to the browser path instead of raising
+    assert _scraper({'items': [{'usertags': {'in': ['alice']}}]}).fetch(POST_URL) is None
+    assert _scraper({'items': []}).fetch(POST_URL) is None
+    assert _scraper(None).fetch(POST_URL) is None
@@ -0,0 +1,44 @@
+"""Tests for PostDataScraper result handling"""
+
+from instaharvest.config import ScraperConfig
+from instaharvest.post_data import PostData, PostDataScraper
+
+
+def _scraper():
+    return PostDataScraper(ScraperConfig(log_file=None, log_to_console=False), enable_diagnostics=False)
+
+
+def test_duplicates_keep_their_own_url_and_content_type():
+    scraper = _scraper()
+    scraped = []
+
+    def fake_unique(urls, **kwargs):
+        for j, url in enumerate(urls, 1):
+            scraped.append(url)
+            yield j, PostData(url=url, tagged_accounts=['alice'], likes='5', timestamp='N/A')
+
+    scraper._iter_scrape_unique = fake_unique
+    urls = [
+        'https://www.instagram.com/p/ABC123/',
+        'https://www.instagram.com/reel/ABC123/',
+        'https://www.instagram.com/p/ABC123/?utm_source=ig_web_copy_link',
+    ]
+
+    results = list(scraper._iter_scrape_indexed(
+        urls,
+        get_tags=True,
+        get_likes=True,
+        get_timestamp=True,
+        delay_between_posts=False,
+        concurrency=None
+    ))
+
+    assert scraped == urls[:1]
+    assert [i for i, _ in results] == [1, 2, 3]
+    assert [data.url for _, data in results] == urls
+    assert [data.content_type for _, data in results] == ['Post', 'Reel', 'Post']
+    assert all(data.likes == '5' for _, data in results)
+
+    # Each position is its own object
+    results[0][1].tagged_accounts.append('bob')
+    assert results[1][1].tagged_accounts == ['alice']